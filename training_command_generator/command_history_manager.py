@@ -1,30 +1,257 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import io
 import os
-import csv
+import mmap
+import pickle
+import sqlite3
+import logging
 import datetime
 
+logger = logging.getLogger(__name__)
+
+# 기본 파일 경로 (모듈 로드 시 한 번만 계산)
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_DEFAULT_CSV_FILE = os.path.join(_MODULE_DIR, 'command_history.csv')
+_DEFAULT_DB_FILE = os.path.join(_MODULE_DIR, 'command_history.db')
+
+# 명령어 히스토리 CSV 헤더 (seq: 기록 순번, op: INS/UPD/DEL 작업 종류)
+HISTORY_FIELDS = ['id', 'timestamp', 'description', 'command', 'exit_code', 'output']
+LOG_FIELDS = HISTORY_FIELDS + ['seq', 'op']
+
+OP_INSERT = 'INS'
+OP_UPDATE = 'UPD'
+OP_DELETE = 'DEL'
+
+# 이 크기 이상의 로그 파일은 mmap으로 읽음 (그보다 작으면 이득이 없음)
+MMAP_MIN_SIZE = 64 * 1024
+
+# sparse_mode에서 기록을 맞출 블록 크기
+SPARSE_BLOCK_SIZE = 4096
+
+# 삭제 표시가 이 개수를 넘으면 로그 압축
+COMPACT_TOMBSTONE_THRESHOLD = 100
+
+# 압축 시 변경 없는 앞부분을 바이트 그대로 복사할 때의 청크 크기
+COPY_CHUNK_SIZE = 1 << 20
+
+def _now_timestamp():
+    """
+    현재 시각을 'YYYY-MM-DD HH:MM:SS' 문자열로 반환 (strftime 대신 f-string으로 포맷)
+    """
+    dt = datetime.datetime.now()
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+
+def _parse_exit_code(value):
+    """
+    CSV의 종료 코드 문자열을 정수로 변환 (비어 있으면 None)
+    """
+    if value is None or value == '':
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+def _quote_field(value):
+    """
+    필드 값을 CSV 문자열로 변환 (쉼표/따옴표/줄바꿈이 있는 경우에만 따옴표 처리)
+    """
+    if value is None:
+        return ''
+    value = str(value)
+    if ',' in value or '"' in value or '\n' in value or '\r' in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+def _format_record(values):
+    """
+    필드 목록을 CSV 한 줄로 변환
+    """
+    return ','.join([_quote_field(v) for v in values]) + '\n'
+
+def _format_log_row(row, seq, op):
+    """
+    명령어 정보를 로그 한 줄로 변환
+    
+    id/seq/op는 따옴표가 필요 없으므로 그대로 쓰고, 나머지 필드만 검사한다.
+    """
+    exit_code = row.get('exit_code')
+    if exit_code is None or isinstance(exit_code, int):
+        exit_code = '' if exit_code is None else exit_code
+    else:
+        exit_code = _quote_field(exit_code)
+    return (f"{row['id']},{_quote_field(row.get('timestamp'))},{_quote_field(row.get('description'))},"
+            f"{_quote_field(row.get('command'))},{exit_code},{_quote_field(row.get('output'))},{seq},{op}\n")
+
+def _copy_bytes(src, dst, length):
+    """
+    src의 처음 length 바이트를 큰 청크 단위로 dst에 복사
+    """
+    while length > 0:
+        chunk = src.read(min(length, COPY_CHUNK_SIZE))
+        if not chunk:
+            raise OSError("로그 파일이 예상보다 짧습니다")
+        dst.write(chunk)
+        length -= len(chunk)
+
+def _parse_record(record):
+    """
+    CSV 한 레코드를 필드 목록으로 분리
+    
+    이 모듈의 기록 방식(큰따옴표 감싸기, 따옴표는 두 번 반복)만 처리한다.
+    """
+    fields = []
+    i = 0
+    n = len(record)
+    while True:
+        if i < n and record[i] == '"':
+            # 따옴표로 감싼 필드
+            parts = []
+            i += 1
+            while True:
+                j = record.find('"', i)
+                if j < 0:
+                    raise ValueError(f"닫히지 않은 따옴표: {record[:50]}")
+                parts.append(record[i:j])
+                if j + 1 < n and record[j + 1] == '"':
+                    parts.append('"')
+                    i = j + 2
+                else:
+                    i = j + 1
+                    break
+            fields.append(''.join(parts))
+            if i >= n:
+                break
+            i += 1  # 구분자(,) 건너뜀
+        else:
+            j = record.find(',', i)
+            if j < 0:
+                fields.append(record[i:])
+                break
+            fields.append(record[i:j])
+            i = j + 1
+    return fields
+
+def _iter_records(lines):
+    """
+    줄 단위 입력에서 CSV 레코드를 하나씩 반환 (따옴표 안의 줄바꿈은 이어 붙임)
+    """
+    pending = None
+    for line in lines:
+        if pending is not None:
+            line = pending + line
+        if line.count('"') % 2:
+            pending = line
+            continue
+        pending = None
+        record = line.rstrip('\r\n')
+        if record:
+            yield _parse_record(record)
+    if pending is not None:
+        yield _parse_record(pending.rstrip('\r\n'))
+
 class CommandHistoryManager:
     """
     생성된 명령어를 CSV 파일로 관리하는 클래스
+    
+    CSV 파일은 추가 전용 로그로 사용된다. 추가/수정/삭제는 모두 파일 끝에
+    한 행을 덧붙이며(수정은 결과 열만 담은 UPD 행, 삭제는 DEL 표시 행),
+    로드 시 ID별로 순서대로 적용한다.
+    죽은 행이 유효 행의 두 배를 넘으면 파일을 다시 작성하여 압축한다.
     """
-    def __init__(self, csv_file_path=None):
+    def __init__(self, csv_file_path=None, sparse_mode=False):
         """
         명령어 히스토리 관리자 초기화
         
         Args:
             csv_file_path (str, optional): CSV 파일 경로. 기본값은 None.
+            sparse_mode (bool, optional): True이면 기록할 때마다 4 KiB 경계까지
+                NUL로 채우고 fsync (연속된 작은 기록이 같은 블록을 다시 쓰지 않음)
         """
         if csv_file_path:
             self.csv_file_path = csv_file_path
         else:
             # 기본 경로는 현재 모듈과 같은 폴더의 command_history.csv
-            self.csv_file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'command_history.csv')
+            self.csv_file_path = _DEFAULT_CSV_FILE
+        
+        self.sparse_mode = sparse_mode
+        
+        # 메모리 캐시 (최초 조회 시 로드)
+        self._by_id = None      # ID -> 명령어 행 (유효 행만, 추가 순서 유지)
+        self._max_id = 0
+        self._seq = 0           # 마지막으로 기록된 seq
+        self._log_rows = 0      # 로그 파일의 전체 행 수 (죽은 행 포함)
+        self._tombstones = set()  # 로그에 삭제 표시(DEL)가 남아 있는 ID
+        
+        # 파일 앞쪽에서 압축 결과와 바이트 단위로 같은 INS 행 구간
+        # (압축 시 이 구간은 다시 포맷하지 않고 그대로 복사)
+        self._clean_rows = 0    # 구간의 행 수
+        self._clean_ends = []   # 구간 내 각 행의 끝 바이트 위치
+        self._clean_pos = {}    # ID -> 구간 내 위치
+        
+        # 캐시 스냅샷 파일 (닫을 때 기록, 로그가 그 뒤로 바뀌지 않았으면 CSV 대신 로드)
+        self.snapshot_path = os.path.splitext(self.csv_file_path)[0] + '.pkl'
+        self._snapshot_key = None  # 스냅샷과 일치하는 로그 파일 상태
+        
+        # 추가 기록용 파일 핸들 (관리자 수명 동안 유지, 압축 시 다시 열림)
+        self._append_fp = None
         
         # 파일이 없으면 생성
         if not os.path.exists(self.csv_file_path):
             self._create_empty_csv()
+        
+        self._open_append()
+    
+    def __del__(self):
+        """
+        파일 핸들만 닫음 (압축과 스냅샷 저장은 하지 않으므로 종료 시에는 close()를 호출해야 함)
+        """
+        try:
+            self._close_append()
+        except Exception:
+            pass
+    
+    def _open_append(self):
+        """
+        추가 기록용 파일 핸들 열기 (여러 행은 버퍼에 모아 한 번에 쓰고, 기록마다 flush)
+        """
+        if self._append_fp is None:
+            self._append_fp = open(self.csv_file_path, 'a', newline='', encoding='utf-8', buffering=1 << 16)
+        return self._append_fp
+    
+    def flush(self, fsync=False):
+        """
+        버퍼에 남은 기록을 파일로 내보냄
+        
+        Args:
+            fsync (bool, optional): True이면 디스크까지 동기화
+        """
+        if self._append_fp is not None:
+            self._append_fp.flush()
+            if fsync:
+                os.fsync(self._append_fp.fileno())
+    
+    def close(self):
+        """
+        삭제 표시가 남아 있으면 로그를 압축한 뒤 파일 핸들을 닫고 캐시 스냅샷을 기록
+        
+        스냅샷은 여기서만 기록되므로 다음 실행에서 CSV 파싱을 건너뛰려면 종료 시 호출해야 한다.
+        """
+        if self._by_id is not None and self._tombstones:
+            self._compact()
+        self._close_append()
+        if self._by_id is not None:
+            self._save_snapshot()
+    
+    def _close_append(self):
+        """
+        추가 기록용 파일 핸들을 닫음 (버퍼 내용은 기록됨)
+        """
+        if self._append_fp is not None:
+            self._append_fp.close()
+            self._append_fp = None
     
     def _create_empty_csv(self):
         """
@@ -32,11 +259,10 @@ class CommandHistoryManager:
         """
         try:
             with open(self.csv_file_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(['id', 'timestamp', 'description', 'command', 'exit_code', 'output'])
+                f.write(_format_record(LOG_FIELDS))
             return True
-        except Exception as e:
-            print(f"CSV 파일 생성 오류: {e}")
+        except OSError as e:
+            logger.error("CSV 파일 생성 오류: %s", e)
             return False
     
     def add_command(self, command, description="", exit_code=None, output=""):
@@ -48,32 +274,404 @@ class CommandHistoryManager:
             description (str, optional): 명령어 설명
             exit_code (int, optional): 명령어 실행 결과 코드
             output (str, optional): 명령어 실행 출력
-            
+        
         Returns:
             int: 추가된 명령어 ID
         """
+        command_ids = self.add_commands([{
+            'command': command,
+            'description': description,
+            'exit_code': exit_code,
+            'output': output
+        }])
+        return command_ids[0] if command_ids else None
+    
+    def add_commands(self, items):
+        """
+        여러 명령어를 한 번에 히스토리에 추가 (파일 기록은 한 번만 수행)
+        
+        Args:
+            items (iterable): 명령어 정보 딕셔너리 목록
+                ('command' 필수, 'description', 'exit_code', 'output' 선택)
+        
+        Returns:
+            list: 추가된 명령어 ID 목록 (오류 시 빈 목록)
+        """
         try:
-            # 기존 명령어 불러오기
-            commands = self.get_all_commands()
-            
-            # 새 ID 생성
-            command_id = 1
-            if commands:
-                command_id = max([int(cmd.get('id', 0)) for cmd in commands]) + 1
+            # 캐시 로드 (필요한 경우에만 파일 읽기)
+            self._load_commands()
             
             # 현재 시간
-            timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            timestamp = _now_timestamp()
+            
+            # 새 ID 생성 (최대 ID를 캐시에서 유지)
+            command_id = self._max_id
+            rows = []
+            for item in items:
+                command_id += 1
+                rows.append({
+                    'id': command_id,
+                    'timestamp': timestamp,
+                    'description': item.get('description', ""),
+                    'command': item['command'],
+                    'exit_code': item.get('exit_code'),
+                    'output': item.get('output', "")
+                })
             
-            # 새 행 추가
-            with open(self.csv_file_path, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow([command_id, timestamp, description, command, exit_code, output])
+            # 로그에 모든 행을 한 번에 추가 후 캐시 갱신
+            self._append_rows(rows, OP_INSERT)
+            for row in rows:
+                self._by_id[row['id']] = row
+            self._max_id = command_id
             
-            return command_id
+            return [row['id'] for row in rows]
         
-        except Exception as e:
-            print(f"명령어 추가 오류: {e}")
-            return None
+        except (OSError, ValueError) as e:
+            logger.error("명령어 추가 오류: %s", e)
+            return []
+    
+    def _load_commands(self):
+        """
+        CSV 로그를 한 번 읽어 메모리 캐시를 구성 (이미 로드된 경우 캐시 반환)
+        
+        Returns:
+            dict: ID -> 명령어 정보
+        """
+        if self._by_id is not None:
+            return self._by_id
+        
+        # 버퍼에 남은 행이 있으면 먼저 기록한 뒤 읽음
+        self.flush()
+        if self._load_snapshot():
+            return self._by_id
+        
+        by_id = {}
+        max_id = 0
+        seq = 0
+        log_rows = 0
+        tombstones = set()
+        clean_ends = []
+        clean_pos = {}
+        clean = False
+        # 헤더가 없는(비어 있거나 없는) 파일도 새 형식으로 작성
+        needs_upgrade = True
+        if os.path.exists(self.csv_file_path):
+            text = self._read_log_text()
+            if text:
+                buf = io.StringIO(text, newline='')
+                records = _iter_records(buf)
+                fieldnames = next(records, None)
+                # seq/op 열이 없는 이전 형식 파일은 로드 후 새 형식으로 다시 작성
+                needs_upgrade = fieldnames is not None and 'op' not in fieldnames
+                # 앞부분 구간의 바이트 위치 추적 (ASCII 파일은 문자 위치와 같음)
+                clean = fieldnames == LOG_FIELDS
+                ascii_only = text.isascii()
+                char_end = buf.tell()
+                byte_end = char_end if ascii_only else len(text[:char_end].encode('utf-8'))
+                for values in records:
+                    # sparse_mode의 채움 줄 무시
+                    if values[0].startswith('\0'):
+                        clean = False
+                        continue
+                    log_rows += 1
+                    if len(values) < len(fieldnames):
+                        values.extend([''] * (len(fieldnames) - len(values)))
+                    row = dict(zip(fieldnames, values))
+                    try:
+                        command_id = int(row.get('id', 0))
+                    except (ValueError, TypeError):
+                        continue
+                    
+                    # ID와 종료 코드는 로드 시 한 번만 정수로 변환
+                    row['id'] = command_id
+                    row['exit_code'] = _parse_exit_code(row.get('exit_code'))
+                    
+                    op = row.pop('op', None) or OP_INSERT
+                    row_seq = row.pop('seq', None)
+                    if row_seq:
+                        seq = max(seq, int(row_seq))
+                    
+                    if (clean and op == OP_INSERT and command_id not in by_id and
+                            row_seq == str(len(clean_ends) + 1)):
+                        # 압축 시 seq가 다시 매겨져도 같은 내용이 되는 행
+                        prev_end = char_end
+                        char_end = buf.tell()
+                        byte_end += (char_end - prev_end if ascii_only else
+                                     len(text[prev_end:char_end].encode('utf-8')))
+                        clean_pos[command_id] = len(clean_ends)
+                        clean_ends.append(byte_end)
+                    else:
+                        clean = False
+                        # 구간 내 행이 수정/삭제되면 그 앞까지만 유효
+                        pos = clean_pos.get(command_id)
+                        if pos is not None and pos < len(clean_ends):
+                            del clean_ends[pos:]
+                    
+                    if op == OP_DELETE:
+                        by_id.pop(command_id, None)
+                        tombstones.add(command_id)
+                    elif op == OP_UPDATE and command_id in by_id:
+                        # UPD 행은 결과 열만 유효 (명령어 열은 비어 있음)
+                        cmd = by_id[command_id]
+                        cmd['exit_code'] = row['exit_code']
+                        cmd['output'] = row.get('output', '')
+                    else:
+                        by_id[command_id] = row
+                        tombstones.discard(command_id)
+                    if command_id > max_id:
+                        max_id = command_id
+        
+        self._by_id = by_id
+        self._max_id = max_id
+        self._seq = seq
+        self._log_rows = log_rows
+        self._tombstones = tombstones
+        self._clean_ends = clean_ends
+        self._clean_pos = clean_pos
+        self._clean_rows = len(clean_ends)
+        
+        if needs_upgrade:
+            self._compact()
+        else:
+            self._maybe_compact()
+        return by_id
+    
+    def _log_file_key(self):
+        """
+        로그 파일 상태 키 (inode, 크기, 수정 시각) - 추가나 교체가 있으면 바뀜
+        """
+        st = os.stat(self.csv_file_path)
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+    
+    def _load_snapshot(self):
+        """
+        로그 파일이 스냅샷 기록 이후 바뀌지 않았으면 스냅샷에서 캐시 복원
+        
+        Returns:
+            bool: 복원 여부 (False이면 CSV를 파싱해야 함)
+        """
+        try:
+            with open(self.snapshot_path, 'rb') as f:
+                snapshot = pickle.load(f)
+            key = self._log_file_key()
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            return False
+        if not isinstance(snapshot, dict) or snapshot.get('key') != key:
+            return False
+        
+        self._by_id = snapshot['by_id']
+        self._max_id = snapshot['max_id']
+        self._seq = snapshot['seq']
+        self._log_rows = snapshot['log_rows']
+        self._tombstones = snapshot['tombstones']
+        self._clean_ends = snapshot['clean_ends']
+        self._clean_pos = snapshot['clean_pos']
+        self._clean_rows = snapshot['clean_rows']
+        self._snapshot_key = key
+        return True
+    
+    def _save_snapshot(self):
+        """
+        현재 캐시를 스냅샷 파일로 기록 (로그 파일이 닫힌 상태에서 호출, 임시 파일 작성 후 교체)
+        """
+        try:
+            key = self._log_file_key()
+            if key == self._snapshot_key:
+                return
+            snapshot = {
+                'key': key,
+                'by_id': self._by_id,
+                'max_id': self._max_id,
+                'seq': self._seq,
+                'log_rows': self._log_rows,
+                'tombstones': self._tombstones,
+                'clean_ends': self._clean_ends,
+                'clean_pos': self._clean_pos,
+                'clean_rows': self._clean_rows,
+            }
+            temp_file = self.snapshot_path + '.temp'
+            with open(temp_file, 'wb') as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, self.snapshot_path)
+            self._snapshot_key = key
+        except OSError as e:
+            logger.error("스냅샷 저장 오류: %s", e)
+    
+    def _read_log_text(self):
+        """
+        로그 파일 전체를 문자열로 읽음
+        
+        큰 파일은 mmap으로 매핑해 커널 버퍼에서 바로 디코딩하고(중간 복사 없음),
+        작은 파일이나 Windows에서는 큰 버퍼로 한 번에 읽는다.
+        
+        Returns:
+            str: 파일 내용
+        """
+        size = os.path.getsize(self.csv_file_path)
+        if size >= MMAP_MIN_SIZE and os.name != 'nt':
+            fd = os.open(self.csv_file_path, os.O_RDONLY)
+            try:
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                    return str(mm, 'utf-8')
+            finally:
+                os.close(fd)
+        
+        # 큰 버퍼로 한 번에 읽고 한 번에 디코딩 (줄 단위 텍스트 I/O 비용 제거)
+        with open(self.csv_file_path, 'rb', buffering=1 << 20) as f:
+            return f.read().decode('utf-8')
+    
+    def _append_row(self, row, op):
+        """
+        로그 파일 끝에 한 행 추가 (임시 파일이나 전체 재작성 없음)
+        
+        Args:
+            row (dict): 명령어 정보
+            op (str): 작업 종류 (INS/UPD/DEL)
+        """
+        self._append_rows([row], op)
+    
+    def _append_rows(self, rows, op):
+        """
+        로그 파일 끝에 여러 행을 한 번의 write 호출로 추가
+        
+        Args:
+            rows (list): 명령어 정보 목록
+            op (str): 작업 종류 (INS/UPD/DEL)
+        """
+        seq = self._seq
+        records = []
+        for row in rows:
+            seq += 1
+            records.append(_format_log_row(row, seq, op))
+        
+        fp = self._open_append()
+        fp.write(''.join(records))
+        if self.sparse_mode:
+            self._pad_to_block(fp)
+        else:
+            # 기록 하나가 사용자 작업 하나이므로 바로 파일로 내보냄 (프로그램이 비정상 종료돼도 유지)
+            fp.flush()
+        self._seq = seq
+        self._log_rows += len(records)
+    
+    def _pad_to_block(self, fp):
+        """
+        파일 끝을 블록 경계까지 NUL 채움 줄로 맞춘 뒤 디스크에 동기화
+        
+        Args:
+            fp: 추가 기록용 파일 핸들
+        """
+        fp.flush()
+        padding = -os.fstat(fp.fileno()).st_size % SPARSE_BLOCK_SIZE
+        if padding:
+            # 채움 줄은 NUL로 시작하며 로드 시 무시됨
+            fp.write('\0' * (padding - 1) + '\n')
+            fp.flush()
+        os.fsync(fp.fileno())
+    
+    def _maybe_compact(self):
+        """
+        삭제 표시나 죽은 행이 많아진 경우에만 로그 압축
+        """
+        if (len(self._tombstones) > COMPACT_TOMBSTONE_THRESHOLD or
+                self._log_rows > 2 * len(self._by_id)):
+            self._compact()
+    
+    def _compact(self):
+        """
+        유효한 행만으로 로그 파일을 새로 작성 (임시 파일 작성 후 교체)
+        """
+        # 교체될 파일을 가리키는 핸들은 닫고, 교체 후 새 파일로 다시 연다
+        self._close_append()
+        temp_file = self.csv_file_path + '.temp'
+        
+        # 변경 없는 앞부분 구간은 원본에서 바이트 그대로 복사하고 나머지만 포맷
+        seq = self._clean_rows
+        clean_ends = self._clean_ends[:seq]
+        clean_pos = {command_id: pos for command_id, pos in self._clean_pos.items() if pos < seq}
+        if seq:
+            offset = clean_ends[-1]
+            records = []
+        else:
+            offset = 0
+            records = [_format_record(LOG_FIELDS).encode('utf-8')]
+            offset += len(records[0])
+        for cmd in self._by_id.values():
+            if cmd['id'] in clean_pos:
+                continue
+            seq += 1
+            record = _format_log_row(cmd, seq, OP_INSERT).encode('utf-8')
+            records.append(record)
+            offset += len(record)
+            clean_pos[cmd['id']] = len(clean_ends)
+            clean_ends.append(offset)
+        
+        with open(temp_file, 'wb') as f:
+            if self._clean_rows:
+                with open(self.csv_file_path, 'rb') as src:
+                    _copy_bytes(src, f, clean_ends[self._clean_rows - 1])
+            f.write(b''.join(records))
+            # 교체 전에 새 파일 내용을 디스크에 기록
+            f.flush()
+            os.fsync(f.fileno())
+        
+        os.replace(temp_file, self.csv_file_path)
+        self._fsync_dir()
+        self._seq = seq
+        self._log_rows = seq
+        self._tombstones = set()
+        self._clean_ends = clean_ends
+        self._clean_pos = clean_pos
+        self._clean_rows = seq
+        self._open_append()
+    
+    def _fsync_dir(self):
+        """
+        파일 교체(rename)가 충돌 후에도 유지되도록 상위 디렉토리를 동기화 (POSIX 전용)
+        """
+        if os.name == 'nt':
+            return
+        dir_fd = os.open(os.path.dirname(os.path.abspath(self.csv_file_path)), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    
+    def _invalidate(self):
+        """
+        메모리 캐시 무효화 (다음 조회 시 파일에서 다시 로드)
+        """
+        self._close_append()
+        self._by_id = None
+        self._max_id = 0
+        self._seq = 0
+        self._log_rows = 0
+        self._tombstones = set()
+        self._clean_rows = 0
+        self._clean_ends = []
+        self._clean_pos = {}
+    
+    def _truncate_clean(self, command_id):
+        """
+        수정/삭제된 ID가 앞부분 구간에 있으면 구간을 그 행 앞까지로 줄임
+        """
+        pos = self._clean_pos.get(command_id)
+        if pos is not None and pos < self._clean_rows:
+            self._clean_rows = pos
+    
+    def iter_commands(self):
+        """
+        명령어 히스토리를 하나씩 순회 (목록 복사 없이 캐시를 그대로 순회)
+        
+        Yields:
+            dict: 명령어 정보 (로그를 읽을 수 없으면 아무것도 반환하지 않음)
+        """
+        try:
+            commands = self._load_commands()
+        except (OSError, ValueError) as e:
+            logger.error("명령어 조회 오류: %s", e)
+            return
+        yield from commands.values()
     
     def get_all_commands(self):
         """
@@ -83,41 +681,50 @@ class CommandHistoryManager:
             list: 명령어 목록 (딕셔너리 형태)
         """
         try:
-            if not os.path.exists(self.csv_file_path):
-                return []
-            
-            commands = []
-            with open(self.csv_file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    commands.append(row)
-            
-            return commands
+            return list(self.iter_commands())
         
-        except Exception as e:
-            print(f"명령어 조회 오류: {e}")
+        except (OSError, ValueError) as e:
+            logger.error("명령어 조회 오류: %s", e)
             return []
     
+    def get_all_commands_df(self):
+        """
+        모든 명령어 히스토리를 DataFrame으로 가져오기 (벡터 연산 필터링용)
+        
+        Returns:
+            pandas.DataFrame: 명령어 목록 (id는 int64, exit_code는 nullable Int64, 오류 시 빈 DataFrame)
+        """
+        # pandas는 이 메서드에서만 필요하므로 지연 임포트
+        import pandas as pd
+        
+        # 로그에는 UPD/DEL 레코드가 섞여 있으므로 재생된 캐시에서 생성
+        try:
+            commands = list(self._load_commands().values())
+        except (OSError, ValueError) as e:
+            logger.error("명령어 조회 오류: %s", e)
+            commands = []
+        df = pd.DataFrame(commands, columns=HISTORY_FIELDS)
+        # 정수가 아닌 종료 코드(로그에 원본 문자열로 남은 값)는 결측값으로 처리
+        exit_code = pd.to_numeric(df['exit_code'], errors='coerce')
+        df['exit_code'] = exit_code.where(exit_code % 1 == 0).astype('Int64')
+        return df.astype({'id': 'int64'})
+    
     def get_command_by_id(self, command_id):
         """
         특정 ID의 명령어 가져오기
         
         Args:
             command_id (int): 명령어 ID
-            
+        
         Returns:
-            dict: 명령어 정보
+            dict: 명령어 정보 (없거나 조회 오류 시 None)
         """
         try:
-            commands = self.get_all_commands()
-            for cmd in commands:
-                if int(cmd.get('id', 0)) == int(command_id):
-                    return cmd
-            
-            return None
+            # 로드 시 구성한 ID 인덱스에서 바로 조회
+            return self._load_commands().get(int(command_id))
         
-        except Exception as e:
-            print(f"명령어 조회 오류: {e}")
+        except (OSError, ValueError) as e:
+            logger.error("명령어 조회 오류: %s", e)
             return None
     
     def update_command_result(self, command_id, exit_code, output):
@@ -128,43 +735,27 @@ class CommandHistoryManager:
             command_id (int): 명령어 ID
             exit_code (int): 실행 결과 코드
             output (str): 명령어 실행 출력
-            
+        
         Returns:
             bool: 성공 여부
         """
         try:
-            commands = self.get_all_commands()
-            updated = False
-            
-            # 임시 파일에 업데이트된 내용 저장
-            temp_file = self.csv_file_path + '.temp'
-            with open(temp_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(['id', 'timestamp', 'description', 'command', 'exit_code', 'output'])
-                
-                for cmd in commands:
-                    row = [cmd['id'], cmd['timestamp'], cmd['description'], cmd['command']]
-                    
-                    if int(cmd['id']) == int(command_id):
-                        row.append(exit_code)
-                        row.append(output)
-                        updated = True
-                    else:
-                        row.append(cmd['exit_code'])
-                        row.append(cmd['output'])
-                    
-                    writer.writerow(row)
-            
-            # 임시 파일을 원래 파일로 대체
-            if updated:
-                os.replace(temp_file, self.csv_file_path)
-                return True
-            else:
-                os.remove(temp_file)
+            cmd = self._load_commands().get(int(command_id))
+            if cmd is None:
                 return False
+            
+            # 결과 열만 담은 UPD 행을 덧붙임 (명령어 본문은 다시 쓰지 않음)
+            cmd['exit_code'] = exit_code
+            cmd['output'] = output
+            self._append_row({'id': cmd['id'], 'exit_code': exit_code, 'output': output}, OP_UPDATE)
+            self._truncate_clean(cmd['id'])
+            self._maybe_compact()
+            return True
         
-        except Exception as e:
-            print(f"명령어 결과 업데이트 오류: {e}")
+        except (OSError, ValueError) as e:
+            # 캐시와 파일이 어긋났을 수 있으므로 다음 조회 시 다시 로드
+            self._invalidate()
+            logger.error("명령어 결과 업데이트 오류: %s", e)
             return False
     
     def delete_command(self, command_id):
@@ -173,35 +764,275 @@ class CommandHistoryManager:
         
         Args:
             command_id (int): 명령어 ID
-            
+        
         Returns:
             bool: 성공 여부
         """
         try:
-            commands = self.get_all_commands()
-            deleted = False
+            command_id = int(command_id)
+            cmd = self._load_commands().pop(command_id, None)
+            if cmd is None:
+                return False
             
-            # 임시 파일에 삭제된 행을 제외한 내용 저장
+            # 삭제 표시 행(DEL)만 덧붙임 (실제 제거는 압축 시점으로 미룸)
+            self._append_row({'id': command_id}, OP_DELETE)
+            self._tombstones.add(command_id)
+            self._truncate_clean(command_id)
+            self._maybe_compact()
+            return True
+        
+        except (OSError, ValueError) as e:
+            # 캐시와 파일이 어긋났을 수 있으므로 다음 조회 시 다시 로드
+            self._invalidate()
+            logger.error("명령어 삭제 오류: %s", e)
+            return False
+    
+    def clear_all(self):
+        """
+        모든 명령어 삭제 (명령어마다 삭제 표시 행을 덧붙이지 않고 빈 로그 파일로 한 번에 교체)
+        
+        Returns:
+            bool: 성공 여부
+        """
+        try:
+            # 교체될 파일을 가리키는 핸들은 닫고, 교체 후 새 파일로 다시 연다
+            self._close_append()
             temp_file = self.csv_file_path + '.temp'
             with open(temp_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(['id', 'timestamp', 'description', 'command', 'exit_code', 'output'])
-                
-                for cmd in commands:
-                    if int(cmd['id']) != int(command_id):
-                        writer.writerow([cmd['id'], cmd['timestamp'], cmd['description'], 
-                                       cmd['command'], cmd['exit_code'], cmd['output']])
-                    else:
-                        deleted = True
+                f.write(_format_record(LOG_FIELDS))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.csv_file_path)
+            self._fsync_dir()
             
-            # 임시 파일을 원래 파일로 대체
-            if deleted:
-                os.replace(temp_file, self.csv_file_path)
-                return True
-            else:
-                os.remove(temp_file)
-                return False
+            self._invalidate()
+            self._by_id = {}
+            self._open_append()
+            return True
+        
+        except OSError as e:
+            # 캐시와 파일이 어긋났을 수 있으므로 다음 조회 시 다시 로드
+            self._invalidate()
+            logger.error("명령어 전체 삭제 오류: %s", e)
+            return False
+
+class SQLiteCommandHistoryManager:
+    """
+    생성된 명령어를 SQLite 데이터베이스로 관리하는 클래스
+    
+    CommandHistoryManager와 같은 공개 메서드를 제공한다. ID로 인덱싱된 조회와
+    행 단위 수정/삭제가 가능하므로 히스토리가 커져도 파일 전체를 다시 쓰지 않는다.
+    """
+    def __init__(self, db_file_path=None):
+        """
+        명령어 히스토리 관리자 초기화
+        
+        Args:
+            db_file_path (str, optional): 데이터베이스 파일 경로. 기본값은 None.
+        """
+        if db_file_path:
+            self.db_file_path = db_file_path
+        else:
+            # 기본 경로는 현재 모듈과 같은 폴더의 command_history.db
+            self.db_file_path = _DEFAULT_DB_FILE
+        
+        # 자동 커밋 모드, WAL 저널로 읽기와 쓰기가 서로 막지 않도록 설정
+        self._conn = sqlite3.connect(self.db_file_path, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS commands ('
+            'id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT, description TEXT, '
+            'command TEXT, exit_code INTEGER, output TEXT)')
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
+    def flush(self, fsync=False):
+        """
+        CommandHistoryManager와의 호환용 (모든 변경은 즉시 커밋됨)
+        """
+        if fsync:
+            self._conn.execute('PRAGMA wal_checkpoint(FULL)')
+    
+    def close(self):
+        """
+        데이터베이스 연결 종료
+        """
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
+    def add_command(self, command, description="", exit_code=None, output=""):
+        """
+        명령어를 히스토리에 추가
+        
+        Args:
+            command (str): 실행된 명령어
+            description (str, optional): 명령어 설명
+            exit_code (int, optional): 명령어 실행 결과 코드
+            output (str, optional): 명령어 실행 출력
+        
+        Returns:
+            int: 추가된 명령어 ID
+        """
+        try:
+            timestamp = _now_timestamp()
+            cursor = self._conn.execute(
+                'INSERT INTO commands (timestamp, description, command, exit_code, output) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (timestamp, description, command, exit_code, output))
+            return cursor.lastrowid
+        
+        except sqlite3.Error as e:
+            logger.error("명령어 추가 오류: %s", e)
+            return None
+    
+    def add_commands(self, items):
+        """
+        여러 명령어를 하나의 트랜잭션으로 히스토리에 추가
+        
+        Args:
+            items (iterable): 명령어 정보 딕셔너리 목록
+                ('command' 필수, 'description', 'exit_code', 'output' 선택)
+        
+        Returns:
+            list: 추가된 명령어 ID 목록 (오류 시 빈 목록)
+        """
+        timestamp = _now_timestamp()
+        command_ids = []
+        try:
+            self._conn.execute('BEGIN')
+            try:
+                for item in items:
+                    cursor = self._conn.execute(
+                        'INSERT INTO commands (timestamp, description, command, exit_code, output) '
+                        'VALUES (?, ?, ?, ?, ?)',
+                        (timestamp, item.get('description', ""), item['command'],
+                         item.get('exit_code'), item.get('output', "")))
+                    command_ids.append(cursor.lastrowid)
+                self._conn.execute('COMMIT')
+            except BaseException:
+                # 어떤 오류든 열린 트랜잭션을 남기지 않음 (다음 BEGIN이 실패하지 않도록)
+                if self._conn.in_transaction:
+                    self._conn.execute('ROLLBACK')
+                raise
+            return command_ids
+        
+        except sqlite3.Error as e:
+            logger.error("명령어 추가 오류: %s", e)
+            return []
+    
+    def get_all_commands(self):
+        """
+        모든 명령어 히스토리 가져오기
+        
+        Returns:
+            list: 명령어 목록 (딕셔너리 형태)
+        """
+        try:
+            rows = self._conn.execute('SELECT * FROM commands ORDER BY id').fetchall()
+            return [dict(row) for row in rows]
+        
+        except sqlite3.Error as e:
+            logger.error("명령어 조회 오류: %s", e)
+            return []
+    
+    def get_command_by_id(self, command_id):
+        """
+        특정 ID의 명령어 가져오기
+        
+        Args:
+            command_id (int): 명령어 ID
+        
+        Returns:
+            dict: 명령어 정보 (없거나 조회 오류 시 None)
+        """
+        try:
+            row = self._conn.execute('SELECT * FROM commands WHERE id = ?', (int(command_id),)).fetchone()
+            return dict(row) if row is not None else None
+        
+        except (sqlite3.Error, ValueError) as e:
+            logger.error("명령어 조회 오류: %s", e)
+            return None
+    
+    def update_command_result(self, command_id, exit_code, output):
+        """
+        명령어 실행 결과 업데이트
+        
+        Args:
+            command_id (int): 명령어 ID
+            exit_code (int): 실행 결과 코드
+            output (str): 명령어 실행 출력
+        
+        Returns:
+            bool: 성공 여부
+        """
+        try:
+            cursor = self._conn.execute(
+                'UPDATE commands SET exit_code = ?, output = ? WHERE id = ?',
+                (exit_code, output, int(command_id)))
+            return cursor.rowcount > 0
+        
+        except sqlite3.Error as e:
+            logger.error("명령어 결과 업데이트 오류: %s", e)
+            return False
+    
+    def delete_command(self, command_id):
+        """
+        명령어 삭제
+        
+        Args:
+            command_id (int): 명령어 ID
+        
+        Returns:
+            bool: 성공 여부
+        """
+        try:
+            cursor = self._conn.execute('DELETE FROM commands WHERE id = ?', (int(command_id),))
+            return cursor.rowcount > 0
+        
+        except sqlite3.Error as e:
+            logger.error("명령어 삭제 오류: %s", e)
+            return False
+    
+    def clear_all(self):
+        """
+        모든 명령어 삭제 (하나의 DELETE 문으로 처리)
+        
+        Returns:
+            bool: 성공 여부
+        """
+        try:
+            self._conn.execute('DELETE FROM commands')
+            return True
+        
+        except sqlite3.Error as e:
+            logger.error("명령어 전체 삭제 오류: %s", e)
+            return False
+    
+    def export_csv(self, csv_file_path):
+        """
+        히스토리를 기존 6열 CSV 형식으로 내보냄 (CommandHistoryManager로 읽을 수 있음)
+        
+        Args:
+            csv_file_path (str): 내보낼 CSV 파일 경로
+        
+        Returns:
+            bool: 성공 여부
+        """
+        try:
+            records = [_format_record(HISTORY_FIELDS)]
+            for row in self._conn.execute('SELECT * FROM commands ORDER BY id'):
+                records.append(_format_record([row[field] for field in HISTORY_FIELDS]))
+            with open(csv_file_path, 'w', newline='', encoding='utf-8') as f:
+                f.write(''.join(records))
+            return True
         
-        except Exception as e:
-            print(f"명령어 삭제 오류: {e}")
-            return False 
\ No newline at end of file
+        except (sqlite3.Error, OSError) as e:
+            logger.error("CSV 내보내기 오류: %s", e)
+            return False
\ No newline at end of file
@@ -1,12 +1,53 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import io
 import os
+import re
 import csv
-import pandas as pd
+import mmap
+import logging
 from datetime import datetime
 import collections
 
+logger = logging.getLogger(__name__)
+
+# 기본 파일 경로 (모듈 로드 시 한 번만 계산)
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_DEFAULT_CSV_FILE = os.path.join(_MODULE_DIR, 'model_configs.csv')
+
+# 구성 인덱스 문자열 형식 (정수 또는 '1.0'처럼 소수점이 붙은 값)
+_IDX_RE = re.compile(r'^-?\d+(?:\.\d+)?$')
+
+def _parse_idx(s):
+    """
+    구성 인덱스 문자열을 정수로 변환 (소수점은 버림)
+    
+    Args:
+        s (str): 인덱스 문자열
+        
+    Returns:
+        int: 구성 인덱스 (숫자가 아니면 None)
+    """
+    return int(float(s)) if _IDX_RE.match(s) else None
+
+def _as_str(value):
+    """
+    CSV에 쓸 값을 문자열로 변환 (이미 문자열이면 그대로, None은 csv.writer처럼 빈 문자열)
+    """
+    if isinstance(value, str):
+        return value
+    return '' if value is None else str(value)
+
+# 체크된 것으로 판단하는 체크박스 값 (소문자, 공백 제거 후 비교)
+_TRUTHY = frozenset({'1', 'true', 'yes', 'y', 'on'})
+
+# CSV 읽기/쓰기 버퍼 크기 (파일 전체를 다시 쓸 때 작은 write 호출이 반복되지 않도록)
+IO_BUFFER_SIZE = 1 << 20
+
+# 이 크기 이상의 CSV 파일은 mmap으로 읽음
+MMAP_MIN_SIZE = 1 << 20
+
 class ConfigCSVManager:
     """
     모델 구성 설정을 CSV 파일로 관리하는 클래스
@@ -22,19 +63,148 @@ class ConfigCSVManager:
             self.csv_file_path = csv_file_path
         else:
             # 기본 경로는 현재 모듈과 같은 폴더의 model_configs.csv
-            self.csv_file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'model_configs.csv')
+            self.csv_file_path = _DEFAULT_CSV_FILE
+        
+        # 파싱된 CSV 행 캐시 (파일 수정 시각/크기가 같으면 다시 읽지 않음)
+        self._cache_rows = None
+        self._cache_mtime = None
+        self._idx_map = {}  # 구성 인덱스 -> 캐시 행 위치
+    
+    def _read_rows(self):
+        """
+        CSV 파일의 모든 행을 반환 (파일이 바뀌지 않았으면 캐시 사용)
+        
+        반환된 목록은 캐시와 공유되므로 수정한 경우 반드시 _write_rows로 저장해야 한다.
+        self._idx_map도 반환된 행에 맞게 갱신된다.
+        
+        Returns:
+            list: CSV 행 목록
+        """
+        key = self._file_key()
+        if self._cache_rows is None or self._cache_mtime != key:
+            self._cache_rows = list(csv.reader(io.StringIO(self._read_text(), newline='')))
+            self._cache_mtime = key
+            self._idx_map = self._build_idx_map(self._cache_rows)
+        return self._cache_rows
+    
+    def _read_text(self):
+        """
+        CSV 파일 전체를 문자열로 읽음
+        
+        큰 파일은 mmap으로 매핑해 페이지 캐시에서 바로 디코딩하고,
+        작은 파일이나 Windows에서는 큰 버퍼로 한 번에 읽는다.
+        
+        Returns:
+            str: 파일 내용
+        """
+        size = os.path.getsize(self.csv_file_path)
+        if size >= MMAP_MIN_SIZE and os.name != 'nt':
+            fd = os.open(self.csv_file_path, os.O_RDONLY)
+            try:
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, 'madvise'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    return str(mm, 'utf-8')
+            finally:
+                os.close(fd)
+        
+        with open(self.csv_file_path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+            return f.read().decode('utf-8')
+    
+    def _file_key(self):
+        """
+        캐시 유효성 검사용 파일 상태 키 (수정 시각, 크기)
+        """
+        st = os.stat(self.csv_file_path)
+        return (st.st_mtime_ns, st.st_size)
+    
+    def _build_idx_map(self, rows):
+        """
+        데이터 행(세 번째 행부터)의 구성 인덱스 -> 행 위치 사전 생성
+        
+        Args:
+            rows (list): CSV 행 목록
+            
+        Returns:
+            dict: 구성 인덱스(int) -> 행 위치 (같은 인덱스가 여럿이면 첫 번째 행)
+        """
+        idx_map = {}
+        for i in range(2, len(rows)):
+            row = rows[i]
+            if not row or not row[0]:
+                continue
+            row_idx = _parse_idx(row[0])
+            if row_idx is None:
+                # 숫자로 변환할 수 없는 경우 무시
+                continue
+            idx_map.setdefault(row_idx, i)
+        return idx_map
+    
+    def _write_rows(self, rows, idx_map=None):
+        """
+        행 목록을 CSV 파일에 쓰고 캐시를 새로 쓴 행으로 갱신
+        
+        임시 파일에 모두 쓴 뒤 교체하므로 쓰는 도중 중단되어도 기존 파일은 그대로 남는다.
+        
+        Args:
+            rows (list): CSV 행 목록
+            idx_map (dict, optional): 호출자가 이미 갱신한 인덱스 사전.
+                None이면 rows에서 다시 생성
+        """
+        temp_file = self.csv_file_path + '.tmp'
+        try:
+            text = self._format_simple_rows(rows)
+            with open(temp_file, 'w', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+                if text is not None:
+                    f.write(text)
+                else:
+                    writer = csv.writer(f)
+                    writer.writerows(rows)
+            os.replace(temp_file, self.csv_file_path)
+        except Exception:
+            # 호출자가 캐시된 행을 이미 수정했을 수 있으므로 다음 읽기 때 다시 파싱
+            self._cache_rows = None
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            raise
+        self._cache_rows = rows
+        self._cache_mtime = self._file_key()
+        self._idx_map = idx_map if idx_map is not None else self._build_idx_map(rows)
+    
+    def _format_simple_rows(self, rows):
+        """
+        따옴표 처리가 필요 없는 행들을 csv.writer 없이 한 문자열로 변환
+        
+        Args:
+            rows (list): CSV 행 목록
+            
+        Returns:
+            str: csv.writer와 같은 형식(줄 끝 CRLF)의 문자열.
+                따옴표가 필요한 값이나 문자열이 아닌 값이 있으면 None
+        """
+        lines = []
+        for row in rows:
+            try:
+                line = ','.join(row)
+            except TypeError:
+                return None
+            # 값 안에 구분자/따옴표/줄바꿈이 있거나, 빈 값 하나뿐인 행('""'로 기록됨)은 csv.writer 사용
+            if (line.count(',') != len(row) - 1 or '"' in line or '\r' in line or '\n' in line or
+                    (len(row) == 1 and not line)):
+                return None
+            lines.append(line)
+        lines.append('')
+        return '\r\n'.join(lines)
     
     def _create_empty_csv(self):
         """
         비어있는 CSV 파일 생성
         """
         try:
-            with open(self.csv_file_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(['idx'])  # 첫 번째 열은 구성 인덱스
+            self._write_rows([['idx']])  # 첫 번째 열은 구성 인덱스
             return True
         except Exception as e:
-            print(f"CSV 파일 생성 오류: {e}")
+            logger.error("CSV 파일 생성 오류: %s", e)
             return False
     
     def capture_current_config(self, checkboxes, env_variables, custom_configs, pre_commands, config_name=None):
@@ -53,50 +223,41 @@ class ConfigCSVManager:
         """
         try:
             # 전달된 데이터의 구조 확인
-            is_proper_format = True
-            
             try:
                 # 체크박스 구성이 이미 적절한 형식(TrainingCommandGenerator에서 전처리됨)인지 확인
-                for section, params in checkboxes.items():
-                    if not isinstance(params, dict):
-                        is_proper_format = False
-                        break
-                    for param, value in params.items():
-                        if not isinstance(value, dict) or 'checked' not in value:
-                            is_proper_format = False
-                            break
-            except Exception:
+                # (처음 어긋나는 항목에서 바로 중단)
+                is_proper_format = all(
+                    isinstance(params, dict) and
+                    all(isinstance(value, dict) and 'checked' in value for value in params.values())
+                    for params in checkboxes.values())
+            except (AttributeError, TypeError):
                 is_proper_format = False
             
             # 데이터가 이미 적절한 형식인 경우
             if is_proper_format:
-                print("이미 처리된 체크박스 구성 데이터 사용")
+                logger.debug("이미 처리된 체크박스 구성 데이터 사용")
                 checkboxes_config = checkboxes
             # 적절한 형식이 아닌 경우 변환 시도
             else:
-                print("체크박스 데이터 형식 변환 필요")
+                logger.debug("체크박스 데이터 형식 변환 필요")
                 checkboxes_config = {}
                 
                 for section_name, section_data in checkboxes.items():
-                    if section_name not in checkboxes_config:
-                        checkboxes_config[section_name] = {}
+                    section_config = checkboxes_config.setdefault(section_name, {})
                     
                     # 리스트 형식인 경우 [(display_name, value, checkbox), ...]
                     if isinstance(section_data, list):
                         for item in section_data:
                             if len(item) >= 3:
                                 display_name, value, checkbox = item[0], item[1], item[2]
-                                try:
-                                    if hasattr(checkbox, 'isChecked'):
-                                        is_checked = checkbox.isChecked()
-                                    else:
-                                        is_checked = False
-                                        print(f"경고: '{section_name}.{display_name}'은(는) isChecked 메서드가 없음")
-                                except Exception as e:
+                                is_checked_fn = getattr(checkbox, 'isChecked', None)
+                                if is_checked_fn is not None:
+                                    is_checked = bool(is_checked_fn())
+                                else:
                                     is_checked = False
-                                    print(f"체크박스 상태 확인 오류: {e}")
+                                    logger.warning("경고: '%s.%s'은(는) isChecked 메서드가 없음", section_name, display_name)
                                 
-                                checkboxes_config[section_name][display_name] = {
+                                section_config[display_name] = {
                                     'display_name': display_name,
                                     'checked': is_checked,
                                     'value': value if is_checked else "0"
@@ -104,19 +265,15 @@ class ConfigCSVManager:
                     # 딕셔너리 형식인 경우 {param_name: checkbox, ...}
                     elif isinstance(section_data, dict):
                         for param_name, checkbox in section_data.items():
-                            try:
-                                if hasattr(checkbox, 'isChecked'):
-                                    is_checked = checkbox.isChecked()
-                                else:
-                                    # 이미 딕셔너리 형식인 경우 ('checked' 키가 있는지 확인)
-                                    if isinstance(checkbox, dict) and 'checked' in checkbox:
-                                        is_checked = checkbox['checked']
-                                    else:
-                                        is_checked = False
-                                        print(f"경고: '{section_name}.{param_name}'은(는) isChecked 메서드가 없고 'checked' 키도 없음")
-                            except Exception as e:
+                            is_checked_fn = getattr(checkbox, 'isChecked', None)
+                            if is_checked_fn is not None:
+                                is_checked = bool(is_checked_fn())
+                            # 이미 딕셔너리 형식인 경우 ('checked' 키가 있는지 확인)
+                            elif isinstance(checkbox, dict) and 'checked' in checkbox:
+                                is_checked = checkbox['checked']
+                            else:
                                 is_checked = False
-                                print(f"체크박스 상태 확인 오류: {e}")
+                                logger.warning("경고: '%s.%s'은(는) isChecked 메서드가 없고 'checked' 키도 없음", section_name, param_name)
                             
                             value = "1" if is_checked else "0"
                             # 값이 있는 경우 가져오기
@@ -124,16 +281,16 @@ class ConfigCSVManager:
                                 if checkbox['value'] and checkbox['value'] != "0":
                                     value = checkbox['value']
                             
-                            checkboxes_config[section_name][param_name] = {
+                            section_config[param_name] = {
                                 'display_name': param_name,
                                 'checked': is_checked,
                                 'value': value
                             }
                     else:
-                        print(f"경고: 지원되지 않는 체크박스 데이터 형식: {type(section_data)}")
+                        logger.warning("경고: 지원되지 않는 체크박스 데이터 형식: %s", type(section_data))
             
             # 데이터 유효성 확인
-            print(f"처리된 체크박스 구성: {checkboxes_config}")
+            logger.debug("처리된 체크박스 구성: %s", checkboxes_config)
             
             # 새 메서드 호출
             config_idx = self.save_config_to_csv(
@@ -142,9 +299,7 @@ class ConfigCSVManager:
             return (config_idx is not None, config_idx)
             
         except Exception as e:
-            import traceback
-            traceback.print_exc()
-            print(f"구성 캡처 오류: {e}")
+            logger.exception("구성 캡처 오류: %s", e)
             return (False, None)
     
     def _transform_csv_format(self):
@@ -153,59 +308,60 @@ class ConfigCSVManager:
         - 첫 번째 행: 섹션 이름 (반복됨)
         - 두 번째 행: 파라미터 이름
         - 세 번째 행 이후: 값
+        
+        이미 변환된 파일(두 번째 행 첫 열이 'idx'이고 '섹션.파라미터' 열이 없음)은 그대로 둔다.
         """
         try:
-            # 저장된 CSV 파일 읽기
-            df = pd.read_csv(self.csv_file_path)
+            # 헤더 두 행만 읽어 이미 변환된 형식인지 확인
+            with open(self.csv_file_path, 'r', newline='', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                header_row1 = next(reader, [])
+                header_row2 = next(reader, [])
+            if header_row2[:1] == ['idx'] and not any('.' in col for col in header_row1):
+                return True
             
-            # 인덱스 열을 정수형으로 변환 (소수점은 버림)
-            df['idx'] = df['idx'].apply(lambda x: int(float(x)) if pd.notnull(x) else 0)
+            # 저장된 CSV 파일 읽기
+            rows = self._read_rows()
+            header = rows[0] if rows else []
+            rows = rows[1:]
             
-            # 섹션별로 컬럼 그룹화
+            # 섹션별로 컬럼 그룹화 (헤더에서 바로 열 위치를 구함)
+            idx_col = header.index('idx') if 'idx' in header else 0
             section_columns = collections.defaultdict(list)
-            for col in df.columns:
+            for ci, col in enumerate(header):
                 if col == 'idx':
                     continue
                 
                 if '.' in col:
                     section, param = col.split('.', 1)
-                    section_columns[section].append((col, param))
+                    section_columns[section].append((ci, param))
+            
+            # 출력 열 순서는 한 번만 계산 (섹션, 파라미터, 원본 열 위치)
+            flat = [(section, param, ci) for section, columns in section_columns.items() for ci, param in columns]
+            header_row1 = ['idx'] + [section for section, _, _ in flat]  # 첫 번째 행: 섹션 이름
+            header_row2 = ['idx'] + [param for _, param, _ in flat]      # 두 번째 행: 파라미터 이름
+            ordered_idxs = [ci for _, _, ci in flat]
+            
+            # 헤더 행과 데이터 행을 한 목록으로 구성 (인덱스는 정수로 변환, 소수점은 버림)
+            # 짧은 행은 헤더 길이만큼 미리 채워 셀마다 길이를 검사하지 않음
+            width = len(header)
+            new_rows = [header_row1, header_row2]
+            for row in rows:
+                if not row:
+                    continue  # 빈 줄은 건너뜀
+                if len(row) < width:
+                    row = row + [''] * (width - len(row))
+                # 숫자가 아닌 인덱스는 전체 변환을 실패시키지 않고 0으로 처리
+                idx = _parse_idx(row[idx_col])
+                new_rows.append([str(idx) if idx is not None else '0'] + [row[ci] for ci in ordered_idxs])
             
             # 새 CSV 파일 작성
-            with open(self.csv_file_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                
-                # 첫 번째 행: 섹션 이름
-                header_row1 = ['idx']
-                
-                # 두 번째 행: 파라미터 이름
-                header_row2 = ['idx']
-                
-                # 각 섹션의 컬럼 추가
-                for section, columns in section_columns.items():
-                    for original_col, param in columns:
-                        header_row1.append(section)
-                        header_row2.append(param)
-                
-                # 헤더 행 작성
-                writer.writerow(header_row1)
-                writer.writerow(header_row2)
-                
-                # 데이터 행 작성
-                for _, row in df.iterrows():
-                    data_row = [int(row['idx'])]  # 인덱스를 정수로 변환하여 저장
-                    
-                    for section, columns in section_columns.items():
-                        for original_col, _ in columns:
-                            value = row.get(original_col, '')
-                            data_row.append(value)
-                    
-                    writer.writerow(data_row)
+            self._write_rows(new_rows)
             
             return True
         
         except Exception as e:
-            print(f"CSV 변환 오류: {e}")
+            logger.error("CSV 변환 오류: %s", e)
             return False
     
     def load_config_from_csv(self, config_name):
@@ -224,147 +380,110 @@ class ConfigCSVManager:
                 return None
             
             # CSV 파일 읽기 (일반 csv 모듈 사용)
-            with open(self.csv_file_path, 'r', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                rows = list(reader)
-                
-                if len(rows) < 3:  # 최소 3행 필요 (섹션, 파라미터, 데이터)
-                    return None
-                
-                # 각 행 파싱
-                section_row = rows[0]  # 첫 번째 행: 섹션
-                param_row = rows[1]    # 두 번째 행: 파라미터
-                
-                # 선택된 구성 인덱스 찾기
-                try:
-                    # 문자열에 '.' 포함된 경우(예: '1.0') 먼저 float로 변환 후 int로 변환
-                    if config_name.replace('.', '', 1).isdigit() and '.' in config_name:
-                        config_idx = int(float(config_name))
-                    else:
-                        config_idx = int(config_name)
-                except ValueError:
-                    print(f"구성 번호 변환 오류: {config_name}은(는) 유효한 숫자가 아닙니다.")
-                    return None
-                
-                # 해당 구성 데이터 찾기
-                data_row = None
-                for row in rows[2:]:  # 세 번째 행부터 데이터
-                    if len(row) > 0 and row[0]:
-                        try:
-                            # 행의 첫 번째 열도 같은 방식으로 변환 시도
-                            row_idx = row[0]
-                            if row_idx.replace('.', '', 1).isdigit() and '.' in row_idx:
-                                row_idx = int(float(row_idx))
-                            else:
-                                row_idx = int(row_idx)
-                                
-                            if row_idx == config_idx:
-                                data_row = row
-                                break
-                        except ValueError:
-                            # 숫자로 변환할 수 없는 경우 무시
-                            continue
-                
-                if data_row is None:
-                    return None
+            rows = self._read_rows()
+            
+            if len(rows) < 3:  # 최소 3행 필요 (섹션, 파라미터, 데이터)
+                return None
+            
+            # 각 행 파싱
+            section_row = rows[0]  # 첫 번째 행: 섹션
+            param_row = rows[1]    # 두 번째 행: 파라미터
+            
+            # 선택된 구성 인덱스 찾기
+            config_idx = _parse_idx(config_name)
+            if config_idx is None:
+                logger.error("구성 번호 변환 오류: %s은(는) 유효한 숫자가 아닙니다.", config_name)
+                return None
+            
+            # 해당 구성 데이터 찾기 (인덱스 사전으로 바로 조회)
+            row_pos = self._idx_map.get(config_idx)
+            if row_pos is None:
+                return None
+            data_row = rows[row_pos]
+            
+            # 결과 데이터 준비
+            checkboxes_config = {}
+            env_variables = []
+            custom_configs = []
+            pre_commands_map = {}  # 명령어 번호 -> 명령어 정보
+            
+            # 디버그용
+            logger.debug("로드된 구성 %s의 데이터 행: %s", config_idx, data_row)
+            
+            # 각 열의 데이터 처리
+            for i in range(1, len(section_row)):
+                if i >= len(data_row):
+                    continue
+                    
+                section = section_row[i]
+                param = param_row[i]
+                value = data_row[i]
                 
-                # 결과 데이터 준비
-                checkboxes_config = {}
-                env_variables = []
-                custom_configs = []
-                pre_commands = []
+                # 값이 없는 경우 스킵 (빈 문자열, 'nan', 등)
+                if not value or value.lower() == 'nan':
+                    continue
                 
                 # 디버그용
-                print(f"로드된 구성 {config_idx}의 데이터 행: {data_row}")
+                logger.debug("처리 중: 섹션=%s, 파라미터=%s, 값=%s", section, param, value)
+                
+                # 빈 섹션 처리
+                if param == "_empty_":
+                    # 빈 섹션임을 나타내는 특수 파라미터
+                    checkboxes_config.setdefault(section, {})["ON"] = {
+                        'display_name': "ON",
+                        'checked': True,  # 항상 체크됨
+                        'value': ""
+                    }
+                    continue
+                
+                # 섹션 별로 데이터 처리
+                if section == 'ENV_VARIABLES':
+                    env_variables.append({
+                        'name': param,
+                        'value': value,
+                        'enabled': True
+                    })
+                
+                elif section == 'CUSTOM_CONFIG':
+                    custom_configs.append({
+                        'param': param,
+                        'value': value,
+                        'enabled': True
+                    })
+                
+                elif section == 'PRE_COMMANDS':
+                    cmd_idx = int(param.replace('cmd_', '')) - 1
+                    pre_commands_map[cmd_idx] = {
+                        'command': value,
+                        'description': f"명령어 {cmd_idx+1}",
+                        'enabled': True
+                    }
                 
-                # 각 열의 데이터 처리
-                for i in range(1, len(section_row)):
-                    if i >= len(data_row):
-                        continue
-                        
-                    section = section_row[i]
-                    param = param_row[i]
-                    value = data_row[i]
+                else:
+                    # 일반 체크박스 설정
+                    # 값이 0/1 또는 True/False 등으로 저장된 경우 불리언 값으로 변환
+                    # "1", "true", "True" 등만 체크된 것으로 판단 (CSV 값은 항상 문자열)
+                    is_checked = value.strip().lower() in _TRUTHY
                     
-                    # 값이 없는 경우 스킵 (빈 문자열, 'nan', 등)
-                    if not value or value.lower() == 'nan':
-                        continue
+                    checkboxes_config.setdefault(section, {})[param] = {
+                        'display_name': param,
+                        'checked': is_checked,
+                        'value': value
+                    }
                     
                     # 디버그용
-                    print(f"처리 중: 섹션={section}, 파라미터={param}, 값={value}")
-                    
-                    # 빈 섹션 처리
-                    if param == "_empty_":
-                        if section not in checkboxes_config:
-                            checkboxes_config[section] = {}
-                        # 빈 섹션임을 나타내는 특수 파라미터
-                        checkboxes_config[section]["ON"] = {
-                            'display_name': "ON",
-                            'checked': True,  # 항상 체크됨
-                            'value': ""
-                        }
-                        continue
-                    
-                    # 섹션 별로 데이터 처리
-                    if section == 'ENV_VARIABLES':
-                        env_variables.append({
-                            'name': param,
-                            'value': value,
-                            'enabled': True
-                        })
-                    
-                    elif section == 'CUSTOM_CONFIG':
-                        custom_configs.append({
-                            'param': param,
-                            'value': value,
-                            'enabled': True
-                        })
-                    
-                    elif section == 'PRE_COMMANDS':
-                        cmd_idx = int(param.replace('cmd_', '')) - 1
-                        while len(pre_commands) <= cmd_idx:
-                            pre_commands.append(None)
-                        
-                        pre_commands[cmd_idx] = {
-                            'command': value,
-                            'description': f"명령어 {cmd_idx+1}",
-                            'enabled': True
-                        }
-                    
-                    else:
-                        # 일반 체크박스 설정
-                        if section not in checkboxes_config:
-                            checkboxes_config[section] = {}
-                        
-                        # 값이 0/1 또는 True/False 등으로 저장된 경우 불리언 값으로 변환
-                        is_checked = False  # 기본값은 체크 해제됨
-                        
-                        # "1", "true", "True" 등만 체크된 것으로 판단
-                        str_value = str(value).lower().strip()
-                        if str_value in ('1', 'true', 'yes', 'y', 'on'):
-                            is_checked = True
-                        
-                        checkboxes_config[section][param] = {
-                            'display_name': param,
-                            'checked': is_checked,
-                            'value': value
-                        }
-                        
-                        # 디버그용
-                        print(f"체크박스 설정: 섹션={section}, 파라미터={param}, 체크={is_checked}, 값={value}")
-                
-                # None 항목 제거
-                pre_commands = [cmd for cmd in pre_commands if cmd is not None]
-                
-                # 디버그용
-                print(f"로드된 체크박스 설정: {checkboxes_config}")
-                
-                return checkboxes_config, env_variables, custom_configs, pre_commands
+                    logger.debug("체크박스 설정: 섹션=%s, 파라미터=%s, 체크=%s, 값=%s", section, param, is_checked, value)
+            
+            # 명령어 번호 순으로 정렬
+            pre_commands = [pre_commands_map[cmd_idx] for cmd_idx in sorted(pre_commands_map)]
+            
+            # 디버그용
+            logger.debug("로드된 체크박스 설정: %s", checkboxes_config)
+            
+            return checkboxes_config, env_variables, custom_configs, pre_commands
         
         except Exception as e:
-            import traceback
-            traceback.print_exc()
-            print(f"구성 로드 오류: {e}")
+            logger.exception("구성 로드 오류: %s", e)
             return None
     
     def get_available_configs(self):
@@ -378,24 +497,18 @@ class ConfigCSVManager:
             if not os.path.exists(self.csv_file_path):
                 return []
             
-            # CSV 파일 읽기
-            with open(self.csv_file_path, 'r', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                rows = list(reader)
-                
-                if len(rows) < 3:  # 최소 3행 필요
-                    return []
-                
-                # 인덱스 추출 (세 번째 행부터)
-                configs = []
-                for row in rows[2:]:
-                    if row and row[0]:
-                        configs.append(row[0])
-                
-                return configs
+            # 캐시가 유효하면 캐시에서 인덱스 추출 (세 번째 행부터)
+            if self._cache_rows is not None and self._cache_mtime == self._file_key():
+                return [row[0] for row in self._cache_rows[2:] if row and row[0]]
+            
+            # 캐시가 없으면 전체 행 목록을 만들지 않고 한 행씩 읽으며 첫 열만 수집
+            reader = csv.reader(io.StringIO(self._read_text(), newline=''))
+            next(reader, None)  # 섹션 행
+            next(reader, None)  # 파라미터 행
+            return [row[0] for row in reader if row and row[0]]
         
         except Exception as e:
-            print(f"구성 목록 조회 오류: {e}")
+            logger.error("구성 목록 조회 오류: %s", e)
             return []
     
     def delete_config(self, config_name):
@@ -413,54 +526,30 @@ class ConfigCSVManager:
                 return False
             
             # CSV 파일 읽기
-            with open(self.csv_file_path, 'r', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                rows = list(reader)
-                
-                if len(rows) < 3:  # 최소 3행 필요
-                    return False
-                
-                # 선택된 구성 인덱스 찾기
-                try:
-                    # 문자열에 '.' 포함된 경우(예: '1.0') 먼저 float로 변환 후 int로 변환
-                    if config_name.replace('.', '', 1).isdigit() and '.' in config_name:
-                        config_idx = int(float(config_name))
-                    else:
-                        config_idx = int(config_name)
-                except ValueError:
-                    print(f"구성 번호 변환 오류: {config_name}은(는) 유효한 숫자가 아닙니다.")
-                    return False
-                
-                # 해당 구성 행 제외하고 다시 쓰기
-                new_rows = [rows[0], rows[1]]  # 헤더 2행은 유지
-                
-                for row in rows[2:]:
-                    if not row or not row[0]:
-                        continue
-                    
-                    try:
-                        # 행의 첫 번째 열도 같은 방식으로 변환 시도
-                        row_idx = row[0]
-                        if row_idx.replace('.', '', 1).isdigit() and '.' in row_idx:
-                            row_idx = int(float(row_idx))
-                        else:
-                            row_idx = int(row_idx)
-                            
-                        if row_idx != config_idx:
-                            new_rows.append(row)
-                    except ValueError:
-                        # 숫자로 변환할 수 없는 경우 행 유지
-                        new_rows.append(row)
-                
-                # CSV 파일 다시 쓰기
-                with open(self.csv_file_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    writer.writerows(new_rows)
-                
+            rows = self._read_rows()
+            
+            if len(rows) < 3:  # 최소 3행 필요
+                return False
+            
+            # 선택된 구성 인덱스 찾기
+            config_idx = _parse_idx(config_name)
+            if config_idx is None:
+                logger.error("구성 번호 변환 오류: %s은(는) 유효한 숫자가 아닙니다.", config_name)
+                return False
+            
+            # 해당 구성 행만 제외하고 다시 쓰기
+            row_pos = self._idx_map.get(config_idx)
+            if row_pos is None:
                 return True
+            new_rows = rows[:row_pos] + rows[row_pos + 1:]
+            
+            # CSV 파일 다시 쓰기
+            self._write_rows(new_rows)
+            
+            return True
         
         except Exception as e:
-            print(f"구성 삭제 오류: {e}")
+            logger.error("구성 삭제 오류: %s", e)
             return False
     
     def rename_config(self, old_name, new_name):
@@ -476,71 +565,38 @@ class ConfigCSVManager:
         """
         try:
             # 새 이름이 숫자인지 확인
-            try:
-                # 점이 포함된 경우 부동 소수점으로 간주하고 정수로 변환
-                if new_name.replace('.', '', 1).isdigit() and '.' in new_name:
-                    new_idx = int(float(new_name))
-                else:
-                    new_idx = int(new_name)
-            except ValueError:
-                print(f"새 구성 번호 변환 오류: {new_name}은(는) 유효한 숫자가 아닙니다.")
+            new_idx = _parse_idx(new_name)
+            if new_idx is None:
+                logger.error("새 구성 번호 변환 오류: %s은(는) 유효한 숫자가 아닙니다.", new_name)
                 return False
             
             # 기존 이름이 숫자인지 확인
-            try:
-                # 점이 포함된 경우 부동 소수점으로 간주하고 정수로 변환
-                if old_name.replace('.', '', 1).isdigit() and '.' in old_name:
-                    old_idx = int(float(old_name))
-                else:
-                    old_idx = int(old_name)
-            except ValueError:
-                print(f"기존 구성 번호 변환 오류: {old_name}은(는) 유효한 숫자가 아닙니다.")
+            old_idx = _parse_idx(old_name)
+            if old_idx is None:
+                logger.error("기존 구성 번호 변환 오류: %s은(는) 유효한 숫자가 아닙니다.", old_name)
                 return False
             
             if not os.path.exists(self.csv_file_path):
                 return False
             
             # CSV 파일 읽기
-            with open(self.csv_file_path, 'r', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                rows = list(reader)
-                
-                if len(rows) < 3:  # 최소 3행 필요
-                    return False
-                
-                # 인덱스 변경
-                changed = False
-                for i in range(2, len(rows)):
-                    if not rows[i] or not rows[i][0]:
-                        continue
-                        
-                    try:
-                        # 행의 첫 번째 열 값을 가져와 변환
-                        row_idx_str = rows[i][0]
-                        # 점이 포함된 경우 부동 소수점으로 간주하고 정수로 변환
-                        if row_idx_str.replace('.', '', 1).isdigit() and '.' in row_idx_str:
-                            row_idx = int(float(row_idx_str))
-                        else:
-                            row_idx = int(row_idx_str)
-                            
-                        if row_idx == old_idx:
-                            rows[i][0] = str(new_idx)
-                            changed = True
-                    except ValueError:
-                        # 숫자로 변환할 수 없는 경우 무시
-                        continue
-                
-                # CSV 파일 다시 쓰기
-                if changed:
-                    with open(self.csv_file_path, 'w', newline='', encoding='utf-8') as f:
-                        writer = csv.writer(f)
-                        writer.writerows(rows)
-                    return True
-                else:
-                    return False
+            rows = self._read_rows()
+            
+            if len(rows) < 3:  # 최소 3행 필요
+                return False
+            
+            # 인덱스 변경
+            row_pos = self._idx_map.get(old_idx)
+            if row_pos is None:
+                return False
+            rows[row_pos][0] = str(new_idx)
+            
+            # CSV 파일 다시 쓰기
+            self._write_rows(rows)
+            return True
         
         except Exception as e:
-            print(f"구성 이름 변경 오류: {e}")
+            logger.error("구성 이름 변경 오류: %s", e)
             return False
     
     def save_config_to_csv(self, checkboxes_config, env_variables, custom_configs, pre_commands, config_name=None):
@@ -558,21 +614,19 @@ class ConfigCSVManager:
             str: 저장된 구성 인덱스
         """
         try:
-            print(f"저장할 체크박스 구성: {checkboxes_config}")
+            logger.debug("저장할 체크박스 구성: %s", checkboxes_config)
             
             # CSV 데이터 준비
             section_row = ["Index"]
             param_row = ["Name" if config_name else ""]
             data_row = []
             
-            # 다음 사용할 인덱스 구하기
-            next_idx = self._get_next_config_idx()
-            
-            # 인덱스 및 이름 설정
+            # 인덱스 및 이름 설정 (이름이 없을 때만 다음 사용할 인덱스를 구함)
+            # 모든 값은 추가할 때 한 번만 문자열로 만들어 두어 쓰기 시 변환 없이 join 가능
             if config_name:
-                data_row.append(config_name)
+                data_row.append(_as_str(config_name))
             else:
-                data_row.append(str(next_idx))
+                data_row.append(str(self._get_next_config_idx()))
             
             # 각 섹션별 데이터 처리
             for section, params in checkboxes_config.items():
@@ -591,47 +645,57 @@ class ConfigCSVManager:
             for env_var in env_variables:
                 if env_var.get('enabled', True):  # 활성화된 환경 변수만 저장
                     section_row.append("ENV_VARIABLES")
-                    param_row.append(env_var['name'])
-                    data_row.append(env_var['value'])
+                    param_row.append(_as_str(env_var['name']))
+                    data_row.append(_as_str(env_var['value']))
             
             # 사용자 정의 설정 처리
             for config in custom_configs:
                 if config.get('enabled', True):  # 활성화된 설정만 저장
                     section_row.append("CUSTOM_CONFIG")
-                    param_row.append(config['param'])
-                    data_row.append(config['value'])
+                    param_row.append(_as_str(config['param']))
+                    data_row.append(_as_str(config['value']))
             
             # 사전 실행 명령어 처리
             for i, cmd in enumerate(pre_commands):
                 if cmd and cmd.get('enabled', True):  # 활성화된 명령어만 저장
                     section_row.append("PRE_COMMANDS")
                     param_row.append(f"cmd_{i+1}")
-                    data_row.append(cmd['command'])
+                    data_row.append(_as_str(cmd['command']))
             
             # 기존 CSV 파일 읽기 (없으면 새로 생성)
             rows = []
             if os.path.exists(self.csv_file_path):
-                with open(self.csv_file_path, 'r', encoding='utf-8') as f:
-                    reader = csv.reader(f)
-                    rows = list(reader)
+                rows = self._read_rows()
+                
+                if len(rows) >= 2:  # 헤더가 2줄 이상 있으면
+                    # 캐시된 행을 직접 수정하지 않도록 복사 (두 헤더 행 길이 맞춤)
+                    existing_section_row = list(rows[0])
+                    existing_param_row = list(rows[1])
+                    header_len = max(len(existing_section_row), len(existing_param_row))
+                    existing_section_row.extend([''] * (header_len - len(existing_section_row)))
+                    existing_param_row.extend([''] * (header_len - len(existing_param_row)))
                     
-                    if len(rows) >= 2:  # 헤더가 2줄 이상 있으면
-                        existing_section_row = rows[0]
-                        existing_param_row = rows[1]
-                        
-                        # 섹션과 파라미터 행 업데이트 (기존 값과 병합)
-                        for i in range(1, len(section_row)):
-                            if i < len(existing_section_row):
-                                # 기존 위치에 덮어쓰기 (이미 존재하면)
-                                existing_section_row[i] = section_row[i]
-                                existing_param_row[i] = param_row[i]
-                            else:
-                                # 새로운 위치에 추가 (존재하지 않으면)
-                                existing_section_row.append(section_row[i])
-                                existing_param_row.append(param_row[i])
-                                
-                        section_row = existing_section_row
-                        param_row = existing_param_row
+                    # 기존 (섹션, 파라미터) -> 열 위치
+                    col_map = {}
+                    for i in range(1, header_len):
+                        col_map.setdefault((existing_section_row[i], existing_param_row[i]), i)
+                    
+                    # 같은 (섹션, 파라미터) 열에 값을 넣고, 없는 열만 헤더 끝에 추가
+                    merged_data_row = [data_row[0]] + [''] * (header_len - 1)
+                    for i in range(1, len(section_row)):
+                        key = (section_row[i], param_row[i])
+                        col = col_map.get(key)
+                        if col is None:
+                            existing_section_row.append(section_row[i])
+                            existing_param_row.append(param_row[i])
+                            merged_data_row.append(data_row[i])
+                            col_map[key] = len(existing_section_row) - 1
+                        else:
+                            merged_data_row[col] = data_row[i]
+                    
+                    section_row = existing_section_row
+                    param_row = existing_param_row
+                    data_row = merged_data_row
             
             # 행 길이 맞추기
             max_len = max(len(section_row), len(param_row), len(data_row))
@@ -647,31 +711,37 @@ class ConfigCSVManager:
                 new_rows.extend(rows[2:])
             
             # 기존에 이미 같은 이름의 구성이 있는지 검사
+            # (new_rows의 데이터 행 위치는 캐시된 rows와 같으므로 인덱스 사전 사용)
             config_idx = data_row[0]
-            replaced = False
-            
-            for i in range(2, len(new_rows)):
-                if len(new_rows[i]) > 0 and str(new_rows[i][0]) == str(config_idx):
-                    # 기존 구성 값 교체
-                    new_rows[i] = data_row
-                    replaced = True
-                    break
+            parsed_idx = _parse_idx(config_idx)
+            idx_map = dict(self._idx_map) if len(rows) > 2 else {}
+            row_pos = None
+            if len(rows) > 2:
+                if parsed_idx is not None:
+                    row_pos = idx_map.get(parsed_idx)
+                else:
+                    # 숫자가 아닌 구성 이름은 문자열로 비교
+                    for i in range(2, len(new_rows)):
+                        if len(new_rows[i]) > 0 and new_rows[i][0] == config_idx:
+                            row_pos = i
+                            break
             
-            # 새 구성 추가 (기존에 없는 경우)
-            if not replaced:
+            if row_pos is not None:
+                # 기존 구성 값 교체
+                new_rows[row_pos] = data_row
+            else:
+                # 새 구성 추가 (기존에 없는 경우)
                 new_rows.append(data_row)
+                if parsed_idx is not None:
+                    idx_map.setdefault(parsed_idx, len(new_rows) - 1)
             
-            # CSV 파일 작성
-            with open(self.csv_file_path, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerows(new_rows)
+            # CSV 파일 작성 (데이터 행 위치가 그대로이므로 갱신한 인덱스 사전을 함께 넘김)
+            self._write_rows(new_rows, idx_map)
             
             return config_idx
             
         except Exception as e:
-            import traceback
-            traceback.print_exc()
-            print(f"구성 저장 오류: {e}")
+            logger.exception("구성 저장 오류: %s", e)
             return None
     
     def _get_next_config_idx(self):
@@ -686,34 +756,14 @@ class ConfigCSVManager:
                 return 1
                 
             # CSV 파일 읽기
-            with open(self.csv_file_path, 'r', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                rows = list(reader)
-                
-                if len(rows) < 3:  # 최소 3행 필요 (헤더 2행 + 데이터 1행)
-                    return 1
-                
-                # 인덱스 추출 (세 번째 행부터)
-                indices = []
-                for row in rows[2:]:
-                    if row and row[0]:
-                        try:
-                            # 숫자로 변환 시도
-                            if row[0].replace('.', '', 1).isdigit():
-                                if '.' in row[0]:
-                                    indices.append(int(float(row[0])))
-                                else:
-                                    indices.append(int(row[0]))
-                        except (ValueError, TypeError):
-                            # 숫자가 아닌 경우 무시
-                            pass
+            rows = self._read_rows()
+            
+            if len(rows) < 3:  # 최소 3행 필요 (헤더 2행 + 데이터 1행)
+                return 1
+            
+            # 가장 큰 인덱스 + 1 반환 (음수 인덱스는 무시)
+            return max(max(self._idx_map, default=0), 0) + 1
                 
-                # 가장 큰 인덱스 + 1 반환
-                if indices:
-                    return max(indices) + 1
-                else:
-                    return 1
-                    
         except Exception as e:
-            print(f"다음 구성 인덱스 가져오기 오류: {e}")
+            logger.error("다음 구성 인덱스 가져오기 오류: %s", e)
             return 1 
\ No newline at end of file
@@ -0,0 +1,391 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import re
+import json
+import logging
+
+from config_csv_manager import ConfigCSVManager, _parse_idx, IO_BUFFER_SIZE
+
+logger = logging.getLogger(__name__)
+
+# 구성 줄 읽기/쓰기: orjson이 있으면 사용 (없으면 표준 json)
+try:
+    import orjson
+    
+    def _json_loads(line):
+        return orjson.loads(line)
+    
+    def _json_line(obj):
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    def _json_loads(line):
+        return json.loads(line)
+    
+    def _json_line(obj):
+        return (json.dumps(obj, ensure_ascii=False) + '\n').encode('utf-8')
+
+# 구성 줄 앞부분의 idx 값 (저장 시 idx가 항상 첫 키이므로 줄 전체를 파싱하지 않고 읽을 수 있음)
+_IDX_PREFIX_RE = re.compile(rb'\s*\{\s*"idx"\s*:\s*("(?:[^"\\]|\\.)*"|-?\d+(?:\.\d+)?)\s*[,}]')
+
+def _read_line_idx(line):
+    """
+    JSONL 구성 줄에서 idx 값만 읽음 (idx가 첫 키가 아닌 줄은 줄 전체를 파싱)
+    
+    Args:
+        line (bytes): 구성 줄
+    
+    Returns:
+        idx 값 (빈 줄이나 손상된 줄이면 None)
+    """
+    match = _IDX_PREFIX_RE.match(line)
+    if match is not None:
+        value = match.group(1)
+        if value.startswith(b'"') and b'\\' not in value:
+            return value[1:-1].decode('utf-8')
+        return _json_loads(value)
+    if not line.strip():
+        return None
+    try:
+        return _json_loads(line).get('idx', '')
+    except (ValueError, AttributeError) as e:
+        logger.warning("손상된 구성 줄 무시: %s", e)
+        return None
+
+# 기본 파일 경로 (모듈 로드 시 한 번만 계산)
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_DEFAULT_JSON_FILE = os.path.join(_MODULE_DIR, 'model_configs.jsonl')
+
+class JSONConfigManager(ConfigCSVManager):
+    """
+    모델 구성 설정을 JSONL 파일(한 줄에 구성 하나)로 관리하는 클래스
+    
+    ConfigCSVManager와 같은 공개 메서드를 제공한다. 구성마다 필요한 항목만
+    저장하므로 (섹션, 파라미터) 열이 계속 늘어나는 CSV와 달리 파일 폭이 커지지 않고,
+    새 구성 저장은 파일 끝에 한 줄을 추가하는 것으로 끝난다.
+    JSONL 파일이 없고 기존 CSV 파일이 있으면 처음 읽을 때 CSV의 구성을 옮겨 온다.
+    """
+    def __init__(self, json_file_path=None, csv_file_path=None):
+        """
+        JSON 구성 관리자 초기화
+        
+        Args:
+            json_file_path (str, optional): JSONL 파일 경로. 기본값은 None.
+            csv_file_path (str, optional): 옮겨 올 기존 CSV 파일 경로. 기본값은 None.
+        """
+        super().__init__(csv_file_path)
+        
+        if json_file_path:
+            self.json_file_path = json_file_path
+        else:
+            # 기본 경로는 현재 모듈과 같은 폴더의 model_configs.jsonl
+            self.json_file_path = _DEFAULT_JSON_FILE
+        
+        # 구성 캐시 (파일 수정 시각/크기가 같으면 다시 읽지 않음)
+        self._configs = None      # 구성 키 -> 구성 데이터 (파일 순서 유지)
+        self._configs_mtime = None
+    
+    def _config_key(self, config_name):
+        """
+        구성 이름을 캐시 키로 변환 (숫자는 '1.0'과 '1'이 같은 키가 되도록 정규화)
+        """
+        config_name = str(config_name)
+        idx = _parse_idx(config_name)
+        return str(idx) if idx is not None else config_name
+    
+    def _json_file_key(self):
+        """
+        캐시 유효성 검사용 JSONL 파일 상태 키 (수정 시각, 크기)
+        """
+        st = os.stat(self.json_file_path)
+        return (st.st_mtime_ns, st.st_size)
+    
+    def _load_configs(self):
+        """
+        JSONL 파일의 모든 구성을 반환 (파일이 바뀌지 않았으면 캐시 사용)
+        
+        Returns:
+            dict: 구성 키 -> 구성 데이터
+        """
+        if not os.path.exists(self.json_file_path):
+            self.migrate_from_csv()
+            if not os.path.exists(self.json_file_path):
+                self._configs = {}
+                self._configs_mtime = None
+                return self._configs
+        
+        key = self._json_file_key()
+        if self._configs is None or self._configs_mtime != key:
+            configs = {}
+            with open(self.json_file_path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        config = _json_loads(line)
+                    except ValueError as e:
+                        logger.warning("손상된 구성 줄 무시: %s", e)
+                        continue
+                    # 같은 구성이 여러 줄이면 마지막 줄이 유효
+                    config_key = self._config_key(config.get('idx', ''))
+                    configs.pop(config_key, None)
+                    configs[config_key] = config
+            self._configs = configs
+            self._configs_mtime = key
+        return self._configs
+    
+    def _rewrite_configs(self, configs):
+        """
+        모든 구성을 JSONL 파일에 다시 쓰고 캐시 갱신 (임시 파일 작성 후 교체)
+        
+        Args:
+            configs (dict): 구성 키 -> 구성 데이터
+        """
+        temp_file = self.json_file_path + '.tmp'
+        try:
+            with open(temp_file, 'wb', buffering=IO_BUFFER_SIZE) as f:
+                f.write(b''.join(_json_line(config) for config in configs.values()))
+            os.replace(temp_file, self.json_file_path)
+        except Exception:
+            # 다음 읽기 때 파일에서 다시 로드
+            self._configs = None
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            raise
+        self._configs = configs
+        self._configs_mtime = self._json_file_key()
+    
+    def _append_config(self, config):
+        """
+        구성 하나를 JSONL 파일 끝에 추가하고 캐시 갱신
+        
+        Args:
+            config (dict): 구성 데이터
+        """
+        with open(self.json_file_path, 'ab') as f:
+            f.write(_json_line(config))
+        self._configs[self._config_key(config['idx'])] = config
+        self._configs_mtime = self._json_file_key()
+    
+    def migrate_from_csv(self):
+        """
+        기존 CSV 파일의 모든 구성을 JSONL 파일로 옮김 (JSONL 파일이 이미 있으면 아무것도 하지 않음)
+        
+        Returns:
+            int: 옮긴 구성 수
+        """
+        if os.path.exists(self.json_file_path) or not os.path.exists(self.csv_file_path):
+            return 0
+        
+        try:
+            configs = {}
+            for config_name in ConfigCSVManager.get_available_configs(self):
+                result = ConfigCSVManager.load_config_from_csv(self, config_name)
+                if result is None:
+                    continue
+                checkboxes_config, env_variables, custom_configs, pre_commands = result
+                configs[self._config_key(config_name)] = {
+                    'idx': config_name,
+                    'checkboxes': checkboxes_config,
+                    'env_variables': env_variables,
+                    'custom_configs': custom_configs,
+                    'pre_commands': pre_commands
+                }
+            self._rewrite_configs(configs)
+            logger.info("CSV 구성 %s개를 %s(으)로 옮김", len(configs), self.json_file_path)
+            return len(configs)
+        
+        except (OSError, ValueError) as e:
+            logger.error("CSV 구성 이전 오류: %s", e)
+            return 0
+    
+    def load_config_from_csv(self, config_name):
+        """
+        특정 구성 로드 (ConfigCSVManager와 같은 이름/반환 형식)
+        
+        Args:
+            config_name (str): 로드할 구성 이름(또는 인덱스)
+        
+        Returns:
+            tuple: (checkboxes_config, env_variables, custom_configs, pre_commands) 또는 None
+        """
+        try:
+            config = self._load_configs().get(self._config_key(config_name))
+            if config is None:
+                return None
+            return (config.get('checkboxes', {}), config.get('env_variables', []),
+                    config.get('custom_configs', []), config.get('pre_commands', []))
+        
+        except OSError as e:
+            logger.error("구성 로드 오류: %s", e)
+            return None
+    
+    def get_available_configs(self):
+        """
+        사용 가능한 구성 목록 반환
+        
+        Returns:
+            list: 구성 인덱스 목록
+        """
+        try:
+            if not os.path.exists(self.json_file_path):
+                # 처음 사용하는 경우 CSV 구성 이전을 포함하여 로드
+                return [config['idx'] for config in self._load_configs().values()]
+            if self._configs is not None and self._configs_mtime == self._json_file_key():
+                return [config['idx'] for config in self._configs.values()]
+            
+            # 캐시가 없으면 각 줄의 앞부분에서 idx만 읽음 (구성 전체를 파싱하지 않음)
+            indices = {}
+            with open(self.json_file_path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+                for line in f:
+                    idx = _read_line_idx(line)
+                    if idx is None:
+                        continue
+                    # 같은 구성이 여러 줄이면 마지막 줄이 유효 (_load_configs와 같은 순서)
+                    key = self._config_key(idx)
+                    indices.pop(key, None)
+                    indices[key] = idx
+            return list(indices.values())
+        
+        except OSError as e:
+            logger.error("구성 목록 조회 오류: %s", e)
+            return []
+    
+    def delete_config(self, config_name):
+        """
+        특정 구성 삭제
+        
+        Args:
+            config_name (str): 삭제할 구성 인덱스
+        
+        Returns:
+            bool: 성공 여부 (ConfigCSVManager와 같이 없는 구성은 True)
+        """
+        if _parse_idx(str(config_name)) is None:
+            logger.error("구성 번호 변환 오류: %s은(는) 유효한 숫자가 아닙니다.", config_name)
+            return False
+        
+        try:
+            configs = dict(self._load_configs())
+            if configs.pop(self._config_key(config_name), None) is None:
+                return True
+            self._rewrite_configs(configs)
+            return True
+        
+        except OSError as e:
+            logger.error("구성 삭제 오류: %s", e)
+            return False
+    
+    def rename_config(self, old_name, new_name):
+        """
+        구성 인덱스 변경
+        
+        Args:
+            old_name (str): 기존 구성 인덱스
+            new_name (str): 새 구성 인덱스
+        
+        Returns:
+            bool: 성공 여부
+        """
+        new_idx = _parse_idx(str(new_name))
+        if new_idx is None:
+            logger.error("새 구성 번호 변환 오류: %s은(는) 유효한 숫자가 아닙니다.", new_name)
+            return False
+        if _parse_idx(str(old_name)) is None:
+            logger.error("기존 구성 번호 변환 오류: %s은(는) 유효한 숫자가 아닙니다.", old_name)
+            return False
+        
+        try:
+            old_key = self._config_key(old_name)
+            configs = self._load_configs()
+            if old_key not in configs:
+                return False
+            
+            # 순서를 유지하면서 키만 바꿈 (같은 번호의 기존 구성은 덮어씀)
+            new_key = str(new_idx)
+            renamed = {}
+            for key, config in configs.items():
+                if key == new_key and key != old_key:
+                    continue
+                if key == old_key:
+                    config = dict(config, idx=new_key)
+                    key = new_key
+                renamed[key] = config
+            self._rewrite_configs(renamed)
+            return True
+        
+        except OSError as e:
+            logger.error("구성 이름 변경 오류: %s", e)
+            return False
+    
+    def save_config_to_csv(self, checkboxes_config, env_variables, custom_configs, pre_commands, config_name=None):
+        """
+        구성 저장 (ConfigCSVManager와 같은 이름/인자, 새 구성은 파일 끝에 한 줄 추가)
+        
+        Args:
+            checkboxes_config (dict): 체크박스 구성 데이터
+            env_variables (list): 환경 변수 설정
+            custom_configs (list): 사용자 정의 설정
+            pre_commands (list): 사전 실행 명령어
+            config_name (str, optional): 구성 이름. 기본값은 None (자동 번호 부여)
+        
+        Returns:
+            str: 저장된 구성 인덱스
+        """
+        try:
+            configs = self._load_configs()
+            config_idx = config_name if config_name else str(self._get_next_config_idx())
+            
+            # CSV 저장 후 다시 로드한 것과 같은 형태로 저장 (활성화된 항목만)
+            config = {
+                'idx': config_idx,
+                'checkboxes': {
+                    section: {
+                        param: {
+                            'display_name': param,
+                            'checked': bool(value.get('checked', False)),
+                            'value': "1" if value.get('checked', False) else "0"
+                        }
+                        for param, value in params.items()
+                    }
+                    for section, params in checkboxes_config.items()
+                },
+                'env_variables': [
+                    {'name': env_var['name'], 'value': env_var['value'], 'enabled': True}
+                    for env_var in env_variables if env_var.get('enabled', True)
+                ],
+                'custom_configs': [
+                    {'param': custom['param'], 'value': custom['value'], 'enabled': True}
+                    for custom in custom_configs if custom.get('enabled', True)
+                ],
+                'pre_commands': [
+                    {'command': cmd['command'], 'description': f"명령어 {i+1}", 'enabled': True}
+                    for i, cmd in enumerate(pre_commands) if cmd and cmd.get('enabled', True)
+                ]
+            }
+            
+            key = self._config_key(config_idx)
+            if key in configs:
+                # 기존 구성 교체 (순서 유지)
+                new_configs = dict(configs)
+                new_configs[key] = config
+                self._rewrite_configs(new_configs)
+            else:
+                self._append_config(config)
+            
+            return config_idx
+        
+        except (OSError, TypeError, ValueError) as e:
+            logger.exception("구성 저장 오류: %s", e)
+            return None
+    
+    def _get_next_config_idx(self):
+        """
+        다음에 사용할 구성 인덱스를 가져옴
+        
+        Returns:
+            int: 다음 사용할 구성 인덱스
+        """
+        indices = [_parse_idx(key) for key in self._load_configs()]
+        return max([idx for idx in indices if idx is not None] + [0]) + 1
\ No newline at end of file
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import command_history_manager
+from command_history_manager import CommandHistoryManager
+
+
+class CompactCleanPrefixTest(unittest.TestCase):
+    """
+    새로 로드한 로그에서도 변경 없는 앞부분 구간을 압축 시 바이트 그대로 복사하는지 확인
+    """
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.tmp_dir, 'command_history.csv')
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+    
+    def _fresh_manager(self):
+        """스냅샷 없이 CSV를 직접 파싱하는 관리자 생성"""
+        manager = CommandHistoryManager(self.csv_path)
+        if os.path.exists(manager.snapshot_path):
+            os.remove(manager.snapshot_path)
+        return manager
+    
+    def test_load_delete_compact_copies_prefix(self):
+        manager = CommandHistoryManager(self.csv_path)
+        for i in range(6):
+            manager.add_command(f"python3 train.py --run {i}", f"명령어 {i}")
+        manager.close()
+        with open(self.csv_path, 'rb') as f:
+            before = f.read()
+        
+        manager = self._fresh_manager()
+        manager.get_all_commands()
+        self.assertEqual(manager._clean_rows, 6)
+        
+        self.assertTrue(manager.delete_command(4))
+        self.assertEqual(manager._clean_rows, 3)
+        
+        copied = []
+        copy_bytes = command_history_manager._copy_bytes
+        
+        def record_copy(src, dst, length):
+            copied.append(length)
+            copy_bytes(src, dst, length)
+        
+        with mock.patch.object(command_history_manager, '_copy_bytes', record_copy):
+            manager._compact()
+        manager.close()
+        
+        with open(self.csv_path, 'rb') as f:
+            after = f.read()
+        self.assertEqual(len(copied), 1)
+        self.assertGreater(copied[0], 0)
+        self.assertEqual(after[:copied[0]], before[:copied[0]])
+        
+        manager = self._fresh_manager()
+        self.assertEqual([cmd['id'] for cmd in manager.get_all_commands()], [1, 2, 3, 5, 6])
+        self.assertEqual(manager._clean_rows, 5)
+        manager.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
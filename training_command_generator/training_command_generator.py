@@ -4,50 +4,447 @@
 import sys
 import os
 import json
+import re
 import configparser
-from collections import defaultdict
-import subprocess
+from itertools import groupby
+from operator import itemgetter
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QGridLayout, QLabel, QLineEdit, 
                              QPushButton, QFileDialog, QCheckBox, QGroupBox,
                              QTextEdit, QScrollArea, QTabWidget, QMessageBox,
-                             QTableWidget, QTableWidgetItem, QHeaderView,
-                             QComboBox, QDialog, QDialogButtonBox, QInputDialog)
-from PyQt5.QtCore import Qt
+                             QTableWidget, QTableWidgetItem, QTableView, QHeaderView,
+                             QComboBox, QDialog, QDialogButtonBox, QInputDialog,
+                             QToolTip, QStyledItemDelegate, QStyleOptionButton, QStyle)
+from PyQt5.QtCore import (Qt, QTimer, QEvent, QAbstractTableModel, QModelIndex,
+                          QRect, QSize, pyqtSignal)
 from PyQt5.QtGui import QColor
-import pandas as pd
 import datetime
-import platform
-import csv
+import shutil
+import logging
+from functools import lru_cache
 
-# 구성 CSV 관리자 모듈 임포트
-from config_csv_manager import ConfigCSVManager
-from command_history_manager import CommandHistoryManager
+# settings.json 읽기/쓰기: orjson이 있으면 사용 (없으면 표준 json)
+try:
+    import orjson
+    
+    def _json_loads(data):
+        return orjson.loads(data)
+    
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+    
+    def _json_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+def _json_dumps_fragments(obj, cache):
+    """
+    최상위 딕셔너리를 _json_dumps와 같은 바이트열로 직렬화하되, 값마다 직렬화한 조각을 재사용
+    
+    값이 이전 호출 때와 같은 객체이면 저장해 둔 조각을 그대로 이어 붙인다.
+    값은 제자리에서 수정하지 않고 새 객체로 교체한다는 전제로 사용한다.
+    
+    Args:
+        obj (dict): 직렬화할 딕셔너리 (문자열 키)
+        cache (dict): 키 -> (값 객체, 직렬화된 조각), 호출 간에 유지
+    
+    Returns:
+        bytes: JSON 바이트열
+    """
+    if not obj:
+        return _json_dumps(obj)
+    
+    parts = []
+    for key, value in obj.items():
+        cached = cache.get(key)
+        if cached is not None and cached[0] is value:
+            fragment = cached[1]
+        else:
+            # 최상위 항목 안쪽이므로 한 단계(2칸) 더 들여쓰기
+            fragment = _json_dumps(key) + b': ' + _json_dumps(value).replace(b'\n', b'\n  ')
+            cache[key] = (value, fragment)
+        parts.append(fragment)
+    return b'{\n  ' + b',\n  '.join(parts) + b'\n}'
+
+# 구성 관리자 모듈 임포트 (JSONL 저장, 기존 CSV 구성은 처음 읽을 때 옮겨 옴)
+from config_json_manager import JSONConfigManager
+from command_history_manager import CommandHistoryManager, SQLiteCommandHistoryManager
+
+logger = logging.getLogger(__name__)
+
+# 테이블 활성화 체크박스 상태 (행마다 반복되는 Qt 속성 조회 대신 사용)
+_CHECKED = Qt.Checked
+_UNCHECKED = Qt.Unchecked
+
+# 실행 파일 기준 경로 (모듈 로드 시 한 번만 계산)
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_SETTINGS_FILE = os.path.join(_MODULE_DIR, 'settings.json')
+_DEFAULT_CONFIG_FILE = os.path.join(_MODULE_DIR, 'default_config.ini')
+
+# 실행 중인 운영체제 (모듈 로드 시 한 번만 판별)
+_PLATFORM = sys.platform.lower()
+_IS_WINDOWS = _PLATFORM.startswith('win')
+_IS_LINUX = _PLATFORM.startswith('linux')
+_IS_MACOS = _PLATFORM.startswith('darwin')
+
+# Linux 터미널 에뮬레이터 후보 (우선순위 순): 실행 파일 이름, 명령어 -> 실행 인자 변환 함수
+_LINUX_TERMINALS = [
+    ('gnome-terminal', lambda cmd: ['gnome-terminal', '--', 'bash', '-c', f'{cmd}; exec bash']),
+    ('konsole', lambda cmd: ['konsole', '--', 'bash', '-c', f'{cmd}; exec bash']),
+    ('xterm', lambda cmd: ['xterm', '-e', 'bash', '-c', f'{cmd}; exec bash']),
+    ('x-terminal-emulator', lambda cmd: ['x-terminal-emulator', '-e', f'bash -c "{cmd}; exec bash"'])
+]
+
+@lru_cache(maxsize=None)
+def _find_linux_terminal():
+    """
+    설치된 첫 번째 Linux 터미널 에뮬레이터 찾기 (결과는 프로세스 동안 재사용)
+    
+    Returns:
+        function: 명령어를 실행 인자 목록으로 바꾸는 함수 또는 None (터미널 없음)
+    """
+    for name, build_args in _LINUX_TERMINALS:
+        if shutil.which(name):
+            return build_args
+    return None
+
+# 단순 INI 파일용 정규식 (섹션 헤더, "키 = 값" 줄, 주석/빈 줄이 아닌 줄)
+_INI_SECTION_RE = re.compile(r'^\[(.+)\].*$', re.M)
+_INI_OPTION_RE = re.compile(r'^([^\s=:#;][^=:\n]*?)[ \t]*[=:][ \t]*(.*?)[ \t\r]*$', re.M)
+_INI_CONTENT_RE = re.compile(r'^[ \t]*[^\s#;]', re.M)
+
+def _read_ini_text(text):
+    """
+    단순한 INI 텍스트를 정규식으로 한 번에 파싱 (옵션 이름 대소문자 유지)
+    
+    여러 줄 값, DEFAULT 섹션, 섹션 밖의 옵션처럼 정규식으로 처리하지 않는 내용이 있으면
+    None을 반환하므로 호출하는 쪽에서 configparser로 다시 파싱해야 한다.
+    
+    Args:
+        text (str): INI 파일 내용
+        
+    Returns:
+        dict: 섹션 이름 -> {옵션 이름: 값} 또는 None
+    """
+    parts = _INI_SECTION_RE.split(text)
+    if _INI_CONTENT_RE.search(parts[0]):
+        return None
+    
+    ini_data = {}
+    for section, body in zip(parts[1::2], parts[2::2]):
+        if section == configparser.DEFAULTSECT:
+            return None
+        options = _INI_OPTION_RE.findall(body)
+        # 옵션으로 읽히지 않은 줄(이어지는 줄 등)이 있으면 configparser에 맡김
+        if len(options) != len(_INI_CONTENT_RE.findall(body)):
+            return None
+        # 같은 섹션/옵션이 다시 나오면 뒤의 값 사용 (순서는 처음 위치 유지)
+        section_data = ini_data.setdefault(sys.intern(section), {})
+        for option, value in options:
+            section_data[sys.intern(option)] = value
+    return ini_data
+
+class EnvVarModel(QAbstractTableModel):
+    """
+    환경 변수 테이블 모델
+    
+    행마다 {'name', 'value', 'enabled'} 딕셔너리를 그대로 보관하고 QTableView에는
+    필요한 셀만 그때그때 제공한다 (셀마다 QTableWidgetItem을 만들지 않음).
+    """
+    HEADERS = ('환경 변수명', '값', '활성화')
+    KEYS = ('name', 'value')  # 텍스트 열 -> 행 딕셔너리 키
+    CHECK_COLUMN = 2  # 활성화 체크박스 열
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._row_by_name = None  # 환경 변수명 -> 첫 행 번호 (필요할 때 만들고 행/이름이 바뀌면 무효화)
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def flags(self, index):
+        if index.column() == self.CHECK_COLUMN:
+            return Qt.ItemIsUserCheckable | Qt.ItemIsEnabled
+        return Qt.ItemIsSelectable | Qt.ItemIsEditable | Qt.ItemIsEnabled
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        var = self._rows[index.row()]
+        if index.column() == self.CHECK_COLUMN:
+            if role == Qt.CheckStateRole:
+                return _CHECKED if var.get('enabled', True) else _UNCHECKED
+            return None
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return var.get(self.KEYS[index.column()], '')
+        return None
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid():
+            return False
+        var = self._rows[index.row()]
+        if index.column() == self.CHECK_COLUMN and role == Qt.CheckStateRole:
+            key, value = 'enabled', value == _CHECKED
+        elif index.column() != self.CHECK_COLUMN and role == Qt.EditRole:
+            key = self.KEYS[index.column()]
+        else:
+            return False
+        # 값이 그대로면 dataChanged를 보내지 않음 (불필요한 자동 저장 방지)
+        if var.get(key, True if key == 'enabled' else '') != value:
+            var[key] = value
+            if key == 'name':
+                self._row_by_name = None
+            self.dataChanged.emit(index, index, [role])
+        return True
+    
+    def rows(self):
+        """
+        현재 행 목록 반환 (빈 이름의 행 포함)
+        
+        Returns:
+            list: 환경 변수 딕셔너리 목록
+        """
+        return self._rows
+    
+    def set_rows(self, env_variables):
+        """
+        행 목록 전체 교체 (모델 리셋 한 번으로 화면 갱신)
+        
+        Args:
+            env_variables (list): 환경 변수 딕셔너리 목록 (복사해서 보관)
+        """
+        self.beginResetModel()
+        self._rows = [dict(var) for var in env_variables]
+        self._row_by_name = None
+        self.endResetModel()
+    
+    def find_row(self, name):
+        """
+        환경 변수명으로 행 번호 검색
+        
+        Args:
+            name (str): 환경 변수명
+        
+        Returns:
+            int: 행 번호 (없으면 -1)
+        """
+        if self._row_by_name is None:
+            # 같은 이름이 여러 행이면 첫 행 사용
+            row_by_name = {}
+            for row, var in enumerate(self._rows):
+                row_by_name.setdefault(var.get('name'), row)
+            self._row_by_name = row_by_name
+        return self._row_by_name.get(name, -1)
+    
+    def append_row(self, name='', value='', enabled=True):
+        """
+        마지막에 행 추가
+        
+        Returns:
+            int: 추가된 행 번호
+        """
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append({'name': name, 'value': value, 'enabled': enabled})
+        if self._row_by_name is not None:
+            self._row_by_name.setdefault(name, row)
+        self.endInsertRows()
+        return row
+    
+    def remove_rows(self, rows):
+        """
+        여러 행 삭제 (뒤쪽 행부터 삭제하여 인덱스 변화 방지)
+        
+        Args:
+            rows (iterable): 삭제할 행 번호들
+        """
+        # 뒤쪽 행 번호가 모두 바뀌므로 이름 색인은 다음 검색 때 다시 만듦
+        self._row_by_name = None
+        for row in sorted(rows, reverse=True):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._rows[row]
+            self.endRemoveRows()
+
+class CommandHistoryModel(QAbstractTableModel):
+    """
+    명령어 히스토리 테이블 모델 (명령어 딕셔너리 목록을 읽기 전용으로 표시)
+    
+    작업 열은 HistoryActionDelegate가 버튼을 그리며, 모든 열의 Qt.UserRole 값은 명령어 ID이다.
+    """
+    HEADERS = ('ID', '시간', '설명', '작업')
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._commands = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._commands)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def flags(self, index):
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        cmd = self._commands[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return str(cmd.get('id', ''))
+            if column == 1:
+                return cmd.get('timestamp', '')
+            if column == 2:
+                return cmd.get('description', '')
+        elif role == Qt.ToolTipRole and column == 2:
+            # 설명 열에 마우스를 올리면 전체 명령어 표시
+            return cmd.get('command', '')
+        elif role == Qt.UserRole:
+            return cmd.get('id')
+        return None
+    
+    def commands(self):
+        """
+        표시 중인 명령어 목록 반환
+        
+        Returns:
+            list: 명령어 딕셔너리 목록 (화면 순서)
+        """
+        return self._commands
+    
+    def set_commands(self, commands):
+        """
+        명령어 목록 전체 교체 (모델 리셋 한 번으로 화면 갱신)
+        
+        Args:
+            commands (list): 명령어 딕셔너리 목록 (화면 순서)
+        """
+        self.beginResetModel()
+        self._commands = commands
+        self.endResetModel()
+
+class HistoryActionDelegate(QStyledItemDelegate):
+    """
+    명령어 히스토리 작업 열의 로드/실행/삭제 버튼을 그리는 델리게이트
+    
+    행마다 버튼 위젯을 만들지 않고 화면에 보이는 셀에만 버튼 모양을 그린다.
+    클릭한 위치로 버튼을 판별하여 actionClicked(버튼 번호, 명령어 ID) 시그널을 보낸다.
+    """
+    ACTION_LOAD, ACTION_RUN, ACTION_DELETE = range(3)
+    BUTTON_LABELS = ('로드', '실행', '삭제')
+    BUTTON_SPACING = 4  # 버튼 사이 간격
+    BUTTON_PADDING = 24  # 버튼 글자 좌우 여백 합
+    
+    actionClicked = pyqtSignal(int, object)
+    
+    def _button_rects(self, rect):
+        """
+        셀 영역을 버튼 수만큼 나눈 버튼 영역 목록 반환
+        
+        Args:
+            rect (QRect): 셀 영역
+        
+        Returns:
+            list: 버튼별 QRect
+        """
+        count = len(self.BUTTON_LABELS)
+        width = (rect.width() - self.BUTTON_SPACING * (count - 1)) // count
+        return [QRect(rect.x() + i * (width + self.BUTTON_SPACING), rect.y(), width, rect.height())
+                for i in range(count)]
+    
+    def paint(self, painter, option, index):
+        widget = option.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        button = QStyleOptionButton()
+        button.state = QStyle.State_Enabled | QStyle.State_Raised
+        for label, rect in zip(self.BUTTON_LABELS, self._button_rects(option.rect)):
+            button.rect = rect
+            button.text = label
+            style.drawControl(QStyle.CE_PushButton, button, painter, widget)
+    
+    def sizeHint(self, option, index):
+        metrics = option.fontMetrics
+        width = sum(metrics.horizontalAdvance(label) + self.BUTTON_PADDING for label in self.BUTTON_LABELS)
+        width += self.BUTTON_SPACING * (len(self.BUTTON_LABELS) - 1)
+        return QSize(width, metrics.height() + 10)
+    
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            for action, rect in enumerate(self._button_rects(option.rect)):
+                if rect.contains(event.pos()):
+                    self.actionClicked.emit(action, index.data(Qt.UserRole))
+                    return True
+        return super().editorEvent(event, model, option, index)
 
 class TrainingCommandGenerator(QMainWindow):
+    # 파일 선택 대화상자 옵션: OS 기본 대화상자 사용, 폴더별 사용자 아이콘 조회 생략
+    FILE_DIALOG_OPTIONS = QFileDialog.ReadOnly | QFileDialog.DontUseCustomDirectoryIcons
+    CHECK_ITEM_FLAGS = Qt.ItemIsUserCheckable | Qt.ItemIsEnabled  # 테이블 활성화 체크박스 항목 플래그
+    STATUS_ERROR_STYLE = "background-color: #ffcccc;"  # 오류 메시지 상태 표시줄 스타일
+    STATUS_OK_STYLE = "background-color: #ccffcc;"  # 일반 메시지 상태 표시줄 스타일
+    SETTINGS_SAVE_DELAY_MS = 300  # 설정 저장 요청을 모아서 쓰는 대기 시간
+    SETTINGS_SYNC_ON_SAVE = False  # True면 설정 저장 시 fsync까지 수행
+    
     def __init__(self):
         super().__init__()
-        self.settings_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'settings.json')
+        self.settings_file = _SETTINGS_FILE
         self.settings = self.load_settings()
+        self._settings_fragments = {}  # 설정 항목별 직렬화 조각 (값 객체가 바뀐 항목만 다시 직렬화)
+        self._last_saved_settings = self._serialize_settings()  # 마지막으로 파일에 쓴 설정 내용
+        
+        # 설정 저장 타이머 (마지막 저장 요청 후 SETTINGS_SAVE_DELAY_MS 동안 요청이 없으면 한 번 저장)
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.SETTINGS_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self._do_save_settings)
+        
+        # 테이블 활성화 체크박스 항목 원본 (행마다 복제해서 사용)
+        self._check_item_proto = QTableWidgetItem()
+        self._check_item_proto.setFlags(self.CHECK_ITEM_FLAGS)
         self.config_file = None
-        self.config_data = defaultdict(dict)
-        self.checkboxes = defaultdict(dict)
-        self.custom_configs = []  # 사용자 정의 설정 값 저장
-        self.pre_commands = []  # 사전 실행 명령어 저장
-        self.env_variables = []  # 환경 변수 저장
-        
-        # CSV 관리자 초기화 (UI 초기화 전에 먼저 실행)
-        self.csv_manager = ConfigCSVManager()
-        self.command_manager = CommandHistoryManager()  # 명령어 히스토리 관리자 추가
+        self.config_data = {}  # 섹션 -> {옵션 이름: 실제 명령어 값}
+        self.checkboxes = {}  # 섹션 -> {옵션 이름: QCheckBox}
+        self._flat_options = []  # (섹션, 체크박스, 명령어 값) 목록, 빈 섹션의 ON 체크박스는 값이 None
+        self._checkbox_values = {}  # 체크박스 -> INI 원본 값 (툴팁 표시용)
+        self._loaded_ini_data = None  # 현재 화면에 표시된 INI 파싱 결과
+        self._status_style = None  # 상태 표시줄에 현재 적용된 스타일
+        self._ini_cache = {}  # 절대 경로 -> (수정 시각, 크기, 파싱된 INI 데이터)
+        # 탭을 만들기 전에도 명령어 생성에 쓸 수 있도록 설정에서 바로 가져옴
+        self.custom_configs = self.settings.get('custom_configs', [])  # 사용자 정의 설정 값 저장
+        self.pre_commands = self.settings.get('pre_commands', [])  # 사전 실행 명령어 저장
+        self.env_variables = self.settings.get('env_variables', [])  # 환경 변수 저장
+        
+        # 구성 관리자 초기화 (UI 초기화 전에 먼저 실행, ConfigCSVManager와 같은 인터페이스)
+        self.csv_manager = JSONConfigManager()
+        # 명령어 히스토리 관리자 (settings의 history_backend가 'sqlite'이면 SQLite 데이터베이스 사용)
+        if self.settings.get('history_backend') == 'sqlite':
+            self.command_manager = SQLiteCommandHistoryManager()
+        else:
+            self.command_manager = CommandHistoryManager()
         
         # UI 초기화
         self.initUI()
         
-        # 시작 시 default_config.ini 파일 로드 시도
-        self.load_default_config()
-        # 이후 settings에 저장된 기본 INI 파일 로드 시도
-        if not self.config_file:
-            self.load_default_ini()
+        # 시작 시 default_config.ini, 이후 settings에 저장된 기본 INI 파일 로드 시도
+        self._initial_load()
         
     def load_settings(self):
         """설정 파일 로드"""
@@ -56,41 +453,83 @@ class TrainingCommandGenerator(QMainWindow):
             'last_script': 'train.py',
             'custom_configs': [],  # 사용자 정의 설정 저장
             'pre_commands': [],  # 사전 실행 명령어 저장
-            'env_variables': []  # 환경 변수 저장
+            'env_variables': [],  # 환경 변수 저장
+            'history_backend': 'csv'  # 명령어 히스토리 저장 방식 ('csv' 또는 'sqlite')
         }
         
-        if os.path.exists(self.settings_file):
-            try:
-                with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    loaded_settings = json.load(f)
-                    settings.update(loaded_settings)
-            except Exception as e:
-                print(f"설정 파일 로드 오류: {e}")
+        try:
+            with open(self.settings_file, 'rb') as f:
+                loaded_settings = _json_loads(f.read())
+                settings.update(loaded_settings)
+        except FileNotFoundError:
+            pass  # 설정 파일이 없으면 기본값 사용
+        except Exception as e:
+            print(f"설정 파일 로드 오류: {e}")
         
         return settings
     
-    def load_default_config(self):
-        """실행 파일과 같은 경로의 default_config.ini 파일 로드 시도"""
-        default_config = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'default_config.ini')
-        if os.path.exists(default_config):
-            self.file_path_edit.setText(default_config)
-            self.load_config()
+    def _initial_load(self):
+        """
+        시작 시 INI 파일 로드 (default_config.ini, settings의 기본 INI 파일 순서로 시도)
+        
+        경로마다 os.stat을 한 번만 호출하고 그 결과를 load_config에 넘겨
+        존재 확인/캐시 확인을 위해 같은 파일을 다시 stat하지 않는다.
+        """
+        for path in (_DEFAULT_CONFIG_FILE, self.settings.get('default_ini_path', '')):
+            if not path:
+                continue
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            self.file_path_edit.setText(path)
+            self.load_config(stat_result=st)
+            if self.config_file:
+                return
             
+    def _serialize_settings(self):
+        """설정을 파일에 쓸 JSON 바이트열로 변환 (바뀌지 않은 항목은 이전 직렬화 결과 재사용)"""
+        return _json_dumps_fragments(self.settings, self._settings_fragments)
+    
     def save_settings(self):
-        """설정 파일 저장"""
+        """설정 파일 저장 예약 (짧은 시간 안의 여러 요청은 한 번의 쓰기로 합침)"""
+        self._save_timer.start()
+    
+    def _do_save_settings(self):
+        """설정 파일 저장 (마지막으로 저장한 내용과 같으면 쓰지 않음, 임시 파일 작성 후 교체)"""
+        self._save_timer.stop()
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, ensure_ascii=False, indent=2)
+            data = self._serialize_settings()
+            if data == self._last_saved_settings:
+                return
+            temp_file = self.settings_file + '.tmp'
+            with open(temp_file, 'wb') as f:
+                f.write(data)
+                if self.SETTINGS_SYNC_ON_SAVE:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(temp_file, self.settings_file)
+            self._last_saved_settings = data
         except Exception as e:
             print(f"설정 파일 저장 오류: {e}")
+    
+    def eventFilter(self, obj, event):
+        """설정 옵션 체크박스에 마우스를 올렸을 때 실제 값 툴팁 표시"""
+        if event.type() == QEvent.ToolTip and obj is self.config_content:
+            child = obj.childAt(event.pos())
+            value = self._checkbox_values.get(child)
+            if value is not None:
+                QToolTip.showText(event.globalPos(), f"실제 값: {value}", child)
+                return True
+        return super().eventFilter(obj, event)
+    
+    def closeEvent(self, event):
+        """창을 닫을 때 저장 대기 중인 설정을 바로 저장하고 명령어 히스토리를 정리(압축/스냅샷 저장)"""
+        if self._save_timer.isActive():
+            self._do_save_settings()
+        self.command_manager.close()
+        super().closeEvent(event)
             
-    def load_default_ini(self):
-        """settings에 저장된 기본 INI 파일 로드 시도"""
-        default_ini = self.settings.get('default_ini_path', '')
-        if default_ini and os.path.exists(default_ini):
-            self.file_path_edit.setText(default_ini)
-            self.load_config()
-        
     def initUI(self):
         self.setWindowTitle('머신러닝 학습 명령어 생성기')
         self.setGeometry(100, 100, 800, 600)
@@ -117,7 +556,7 @@ class TrainingCommandGenerator(QMainWindow):
         browse_button.clicked.connect(self.browse_ini_file)
         
         load_button = QPushButton('로드')
-        load_button.clicked.connect(self.load_config)
+        load_button.clicked.connect(lambda: self.load_config())
         
         set_default_button = QPushButton('기본 경로로 설정')
         set_default_button.clicked.connect(self.set_default_ini_path)
@@ -216,17 +655,16 @@ class TrainingCommandGenerator(QMainWindow):
         self.config_scroll.setWidget(self.config_content)
         self.config_content_layout = QVBoxLayout(self.config_content)
         
-        # 사용자 정의 설정 탭 구성
-        self.setup_custom_config_tab()
-        
-        # 사전 명령어 탭 구성
-        self.setup_pre_commands_tab()
-        
-        # 환경 변수 탭 구성
+        # 환경 변수 탭 구성 (처음 표시되는 탭이므로 바로 구성)
         self.setup_env_variables_tab()
         
-        # 명령어 히스토리 탭 구성
-        self.setup_command_history_tab()
+        # 사용자 정의 설정/사전 명령어/명령어 히스토리 탭은 처음 선택될 때 구성
+        self._lazy_tabs = {
+            self.custom_tab: self.setup_custom_config_tab,
+            self.pre_commands_tab: self.setup_pre_commands_tab,
+            self.command_history_tab: self.setup_command_history_tab
+        }
+        self.tabs.currentChanged.connect(self._lazy_build_tab)
         
         # Command output section
         command_group = QGroupBox('생성된 명령어')
@@ -267,6 +705,35 @@ class TrainingCommandGenerator(QMainWindow):
         command_group.setLayout(command_layout)
         main_layout.addWidget(command_group)
         
+    def _lazy_build_tab(self, index):
+        """탭이 선택되었을 때 아직 구성하지 않은 탭이면 구성"""
+        self._ensure_tab_built(self.tabs.widget(index))
+    
+    def _ensure_tab_built(self, tab):
+        """
+        지연 구성 대상 탭을 한 번만 구성
+        
+        Args:
+            tab (QWidget): 탭 위젯
+        """
+        setup = self._lazy_tabs.pop(tab, None)
+        if setup is not None:
+            setup()
+    
+    def _new_check_item(self, state):
+        """
+        테이블 활성화 체크박스 열에 넣을 항목 생성 (미리 만든 원본 항목 복제)
+        
+        Args:
+            state (Qt.CheckState): 체크 상태
+            
+        Returns:
+            QTableWidgetItem: 체크박스 항목
+        """
+        item = self._check_item_proto.clone()
+        item.setCheckState(state)
+        return item
+    
     def setup_custom_config_tab(self):
         """사용자 정의 설정 탭 설정"""
         # 테이블 위젯 생성
@@ -318,7 +785,7 @@ class TrainingCommandGenerator(QMainWindow):
                 
             param = self.custom_config_table.item(row, 0).text().strip()
             value = self.custom_config_table.item(row, 1).text().strip()
-            is_enabled = self.custom_config_table.item(row, 2).checkState() == Qt.Checked
+            is_enabled = self.custom_config_table.item(row, 2).checkState() == _CHECKED
             
             if param:  # 파라미터가 빈 값이 아닌 경우만 저장
                 custom_configs.append({
@@ -343,28 +810,28 @@ class TrainingCommandGenerator(QMainWindow):
         
         self.custom_configs = self.settings.get('custom_configs', [])
         
-        # 테이블 초기화
-        self.custom_config_table.setRowCount(0)
+        # 테이블 초기화 (채우는 동안 화면 갱신/시그널 중지, 행은 한 번에 생성)
+        table = self.custom_config_table
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        table.setRowCount(0)
+        table.setRowCount(len(self.custom_configs))
         
         # 저장된 설정 추가
-        for config in self.custom_configs:
-            row = self.custom_config_table.rowCount()
-            self.custom_config_table.insertRow(row)
-            
+        for row, config in enumerate(self.custom_configs):
             # 파라미터 열
-            param_item = QTableWidgetItem(config.get('param', ''))
-            self.custom_config_table.setItem(row, 0, param_item)
+            table.setItem(row, 0, QTableWidgetItem(config.get('param', '')))
             
             # 값 열
-            value_item = QTableWidgetItem(config.get('value', ''))
-            self.custom_config_table.setItem(row, 1, value_item)
+            table.setItem(row, 1, QTableWidgetItem(config.get('value', '')))
             
             # 활성화 체크박스 열
-            checkbox = QTableWidgetItem()
-            checkbox.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-            checkbox.setCheckState(Qt.Checked if config.get('enabled', True) else Qt.Unchecked)
-            self.custom_config_table.setItem(row, 2, checkbox)
-            
+            checkbox = self._new_check_item(_CHECKED if config.get('enabled', True) else _UNCHECKED)
+            table.setItem(row, 2, checkbox)
+        
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
+        
         # 로딩 완료 플래그 해제
         self._loading_custom_configs = False
     
@@ -382,14 +849,12 @@ class TrainingCommandGenerator(QMainWindow):
         self.custom_config_table.setItem(row, 1, value_item)
         
         # 활성화 체크박스 열
-        checkbox = QTableWidgetItem()
-        checkbox.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-        checkbox.setCheckState(Qt.Checked)
+        checkbox = self._new_check_item(_CHECKED)
         self.custom_config_table.setItem(row, 2, checkbox)
     
     def delete_custom_config_row(self):
         """선택한 행 삭제"""
-        selected_rows = list(set([index.row() for index in self.custom_config_table.selectedIndexes()]))
+        selected_rows = {index.row() for index in self.custom_config_table.selectedIndexes()}
         if not selected_rows:
             self.show_status_message('삭제할 행을 선택해주세요.', True)
             return
@@ -414,8 +879,10 @@ class TrainingCommandGenerator(QMainWindow):
             self.show_status_message('먼저 INI 파일을 선택해주세요.', True)
             return
             
-        self.settings['default_ini_path'] = current_path
-        self.save_settings()
+        # 경로가 바뀐 경우에만 설정 저장
+        if self.settings.get('default_ini_path') != current_path:
+            self.settings['default_ini_path'] = current_path
+            self.save_settings()
         self.show_status_message(f'기본 INI 파일 경로가 설정되었습니다: {current_path}')
         
     def browse_ini_file(self):
@@ -424,144 +891,218 @@ class TrainingCommandGenerator(QMainWindow):
         if self.settings.get('default_ini_path'):
             default_dir = os.path.dirname(self.settings['default_ini_path'])
             
-        file_path, _ = QFileDialog.getOpenFileName(self, '설정 파일 선택', default_dir, 'INI Files (*.ini)')
+        file_path, _ = QFileDialog.getOpenFileName(self, '설정 파일 선택', default_dir, 'INI Files (*.ini)',
+                                                   options=self.FILE_DIALOG_OPTIONS)
         if file_path:
             self.file_path_edit.setText(file_path)
     
     def browse_script_file(self):
-        file_path, _ = QFileDialog.getOpenFileName(self, '학습 스크립트 선택', '', 'Python Files (*.py)')
+        file_path, _ = QFileDialog.getOpenFileName(self, '학습 스크립트 선택', '', 'Python Files (*.py)',
+                                                   options=self.FILE_DIALOG_OPTIONS)
         if file_path:
             # 파일 이름만 추출
             script_name = os.path.basename(file_path)
             self.script_edit.setText(script_name)
-            # 스크립트 이름 설정에 저장
-            self.settings['last_script'] = script_name
-            self.save_settings()
+            # 스크립트 이름 설정에 저장 (바뀐 경우에만)
+            if self.settings.get('last_script') != script_name:
+                self.settings['last_script'] = script_name
+                self.save_settings()
     
-    def load_config(self):
+    def load_config(self, stat_result=None):
+        """
+        입력된 INI 파일을 로드하여 설정 옵션 UI 생성
+        
+        Args:
+            stat_result (os.stat_result, optional): 이미 구한 파일 상태 (있으면 다시 stat하지 않음). 기본값은 None.
+        """
         config_path = self.file_path_edit.text()
-        if not config_path or not os.path.exists(config_path):
+        if not config_path:
             self.show_status_message('INI 파일을 선택해주세요.', True)
             return
         
+        # Parse config file (파일이 바뀌지 않았으면 이전 파싱 결과 재사용)
+        try:
+            ini_data = self._parse_ini_file(config_path, stat_result)
+        except OSError:
+            self.show_status_message('INI 파일을 선택해주세요.', True)
+            return
+        
+        # 같은 파일이 바뀌지 않았으면 (캐시된 파싱 결과가 그대로면) 화면을 다시 만들지 않음
+        if config_path == self.config_file and ini_data is self._loaded_ini_data:
+            self.show_status_message('이미 로드된 설정 파일입니다.')
+            return
+        
         self.config_file = config_path
         self.config_data.clear()
         self.checkboxes.clear()
+        self._flat_options = []
+        self._checkbox_values = {}
         
-        # Clear the content layouts
-        self._clear_layout(self.config_content_layout)
+        # 위젯을 모두 만들 때까지 화면 갱신 중지 (레이아웃 계산/다시 그리기를 마지막에 한 번만 수행)
+        self.tabs.setUpdatesEnabled(False)
         
-        # Parse config file - 원본 대소문자 유지를 위해 옵션 추가
-        config = configparser.ConfigParser()
-        
-        # 대소문자 유지 옵션을 추가
         try:
-            # ConfigParser 인스턴스 생성 시 대소문자를 유지하는 옵션 설정
-            config._sections = dict()  # 섹션 이름 대소문자 유지를 위한 설정
-            
-            # 파일을 직접 읽어서 처리
-            with open(config_path, encoding='utf-8') as f:
-                config.read_file(f)
-            
-            # 디버그 메시지
-            print(f"INI 파일 대소문자 유지 로드 성공: {config.sections()}")
-            
-        except Exception as e:
-            # 실패 시 기본 방식으로 다시 시도
-            print(f"대소문자 유지 로드 실패, 기본 방식으로 재시도: {e}")
-            config = configparser.ConfigParser()
-            config.read(config_path, encoding='utf-8')
-        
-        # Process sections and options
-        for section in config.sections():
-            # 새 컨셉: 섹션이 명령어 파라미터 이름, 변수는 UI에 표시할 이름, 값은 실제 명령어 값
-            param_name = section  # 명령어 파라미터 이름
-            
-            # 모든 설정을 config_content_layout에 추가 (시스템 설정 구분 없이)
-            layout = self.config_content_layout
-            
-            # Create a group box for each section (parameter)
-            group_box = QGroupBox(param_name)
-            group_layout = QVBoxLayout()
-            
-            # 체크박스를 그리드 레이아웃으로 변경하여 여러 줄로 표시되도록 함
-            checkbox_grid = QGridLayout()
-            checkbox_grid.setAlignment(Qt.AlignLeft)
-            checkbox_grid.setHorizontalSpacing(10)  # 체크박스 간 간격 설정
-            checkbox_grid.setVerticalSpacing(5)     # 줄 간 간격 설정
-            
-            # 체크박스 관리 구조 변경: 배열 -> 딕셔너리 (키로 원래 이름 사용)
-            checkbox_dict = {}
-            
-            # 섹션 내 옵션이 없는 경우
-            if len(config[section]) == 0:
-                # 빈 섹션인 경우 "ON" 옵션 하나만 추가
-                checkbox = QCheckBox("ON")
-                checkbox.setChecked(True)  # 기본적으로 체크됨
-                checkbox.setToolTip("빈 섹션: 값 없이 파라미터만 추가")
-                checkbox_grid.addWidget(checkbox, 0, 0)
-                checkbox_dict["ON"] = checkbox
-            else:
-                # 섹션 내 옵션이 있는 경우 그리드에 추가 (한 줄에 최대 4개)
-                max_columns = 4
-                row, col = 0, 0
+            # 새 내용 위젯은 화면 밖에서 모두 채운 뒤 마지막에 한 번만 스크롤 영역에 넣음
+            content = QWidget()
+            content_layout = QVBoxLayout(content)
+            # 옵션 체크박스 툴팁은 마우스를 올렸을 때 만듦 (eventFilter 참고)
+            content.installEventFilter(self)
+            
+            # Process sections and options
+            for section, options in ini_data.items():
+                # 새 컨셉: 섹션이 명령어 파라미터 이름, 변수는 UI에 표시할 이름, 값은 실제 명령어 값
+                param_name = section  # 명령어 파라미터 이름
                 
-                # 첫 번째 옵션을 체크할지 여부를 추적하는 변수
-                first_option = True
+                # 모든 설정을 content_layout에 추가 (시스템 설정 구분 없이)
+                layout = content_layout
                 
-                for option_name in config[section]:
-                    # option_name: INI 파일에 적힌 원본 이름 (대소문자 유지)
-                    cmd_value = config[section][option_name]  # 실제 명령어 값
-                    
-                    # 체크박스 레이블에 원본 이름 사용 (대소문자 유지)
-                    checkbox = QCheckBox(str(option_name))  # str()로 감싸서 대소문자 유지
-                    
-                    # 첫 번째 옵션만 체크, 나머지는 체크 해제
-                    checkbox.setChecked(first_option)
-                    first_option = False  # 첫 번째 옵션 처리 후 플래그 해제
+                # Create a group box for each section (parameter)
+                group_box = QGroupBox(param_name)
+                
+                # 체크박스를 그리드 레이아웃으로 변경하여 여러 줄로 표시되도록 함 (그룹 박스의 유일한 레이아웃)
+                checkbox_grid = QGridLayout()
+                checkbox_grid.setAlignment(Qt.AlignLeft)
+                checkbox_grid.setHorizontalSpacing(10)  # 체크박스 간 간격 설정
+                checkbox_grid.setVerticalSpacing(5)     # 줄 간 간격 설정
+                
+                # 체크박스 관리 구조 변경: 배열 -> 딕셔너리 (키로 원래 이름 사용)
+                checkbox_dict = {}
+                
+                # 섹션 내 옵션이 없는 경우
+                if len(options) == 0:
+                    # 빈 섹션인 경우 "ON" 옵션 하나만 추가
+                    checkbox = QCheckBox("ON")
+                    checkbox.setChecked(True)  # 기본적으로 체크됨
+                    checkbox.setToolTip("빈 섹션: 값 없이 파라미터만 추가")
+                    checkbox_grid.addWidget(checkbox, 0, 0)
+                    checkbox_dict["ON"] = checkbox
+                    self._flat_options.append((section, checkbox, None))
+                else:
+                    # 섹션 내 옵션이 있는 경우 그리드에 추가 (한 줄에 최대 4개)
+                    max_columns = 4
+                    row, col = 0, 0
                     
-                    checkbox.setToolTip(f"실제 값: {cmd_value}")  # 툴툽으로 실제 값 표시
+                    # 최종 행/열 크기를 미리 지정해 그리드 셀 배열을 한 번에 확보 (stretch 0은 기본값이라 배치는 그대로)
+                    rows = (len(options) + max_columns - 1) // max_columns
+                    checkbox_grid.setRowStretch(rows - 1, 0)
+                    checkbox_grid.setColumnStretch(min(len(options), max_columns) - 1, 0)
                     
-                    # 그리드에 체크박스 추가
-                    checkbox_grid.addWidget(checkbox, row, col)
-                    checkbox_dict[option_name] = checkbox
+                    # 첫 번째 옵션을 체크할지 여부를 추적하는 변수
+                    first_option = True
                     
-                    # 다음 위치 계산
-                    col += 1
-                    if col >= max_columns:
-                        col = 0
-                        row += 1
-            
-            # 체크박스 그리드를 전체 레이아웃에 추가
-            group_layout.addLayout(checkbox_grid)
-            group_box.setLayout(group_layout)
-            layout.addWidget(group_box)
+                    for option_name, cmd_value in options.items():
+                        # option_name: INI 파일에 적힌 옵션 이름, cmd_value: 실제 명령어 값
+                        
+                        # 체크박스 레이블에 원본 이름 사용 (대소문자 유지)
+                        checkbox = QCheckBox(str(option_name))  # str()로 감싸서 대소문자 유지
+                        
+                        # 첫 번째 옵션만 체크 (새 체크박스는 체크 해제 상태이므로 나머지는 호출 생략)
+                        if first_option:
+                            checkbox.setChecked(True)
+                            first_option = False  # 첫 번째 옵션 처리 후 플래그 해제
+                        
+                        self._checkbox_values[checkbox] = cmd_value  # 툴팁으로 실제 값 표시
+                        
+                        # 그리드에 체크박스 추가
+                        checkbox_grid.addWidget(checkbox, row, col)
+                        checkbox_dict[option_name] = checkbox
+                        # 값이 없으면 옵션 이름을 명령어 값으로 사용
+                        self._flat_options.append((section, checkbox, cmd_value or option_name))
+                        
+                        # 다음 위치 계산
+                        col += 1
+                        if col >= max_columns:
+                            col = 0
+                            row += 1
+                
+                # 체크박스 그리드를 그룹 박스 레이아웃으로 바로 사용
+                group_box.setLayout(checkbox_grid)
+                layout.addWidget(group_box)
+                
+                # Store checkboxes and values for later reference
+                self.checkboxes[section] = checkbox_dict
+                self.config_data[section] = options  # 옵션 이름 -> 실제 명령어 값
+                
+                # 디버그용: 체크박스 정보 출력
+                logger.debug("섹션 '%s'에 체크박스 %d개 생성", section, len(checkbox_dict))
             
-            # Store checkboxes and values for later reference
-            self.checkboxes[section] = checkbox_dict
+            # 기존 내용 위젯을 통째로 떼어 내고 한 번만 지연 삭제 (하위 위젯은 Qt가 함께 삭제함)
+            old_content = self.config_scroll.takeWidget()
+            if old_content is not None:
+                old_content.deleteLater()
+            self.config_scroll.setWidget(content)
+            self.config_content = content
+            self.config_content_layout = content_layout
             
-            # 디버그용: 체크박스 정보 출력
-            print(f"섹션 '{section}'에 체크박스 {len(checkbox_dict)}개 생성")
+        finally:
+            self.tabs.setUpdatesEnabled(True)
+        
+        self._loaded_ini_data = ini_data
         
         # Message if successful
         self.show_status_message('설정 파일을 성공적으로 로드했습니다.')
     
-    def _clear_layout(self, layout):
-        if layout is not None:
-            while layout.count():
-                item = layout.takeAt(0)
-                widget = item.widget()
-                if widget is not None:
-                    widget.deleteLater()
-                else:
-                    self._clear_layout(item.layout())
+    def _parse_ini_file(self, config_path, stat_result=None):
+        """
+        INI 파일을 파싱하여 섹션별 옵션 딕셔너리 반환
+        
+        (경로, 수정 시각, 크기)가 같으면 이전 파싱 결과를 그대로 사용한다.
+        
+        Args:
+            config_path (str): INI 파일 경로
+            stat_result (os.stat_result, optional): 이미 구한 파일 상태. 기본값은 None.
+            
+        Returns:
+            dict: 섹션 이름 -> {옵션 이름: 값}
+        """
+        config_path = os.path.abspath(config_path)
+        st = stat_result if stat_result is not None else os.stat(config_path)
+        cached = self._ini_cache.get(config_path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        
+        # 파일을 한 번에 읽어서 처리 (앞에서 구한 크기만큼 읽어 크기 확인용 fstat/추가 read 생략)
+        with open(config_path, 'rb', buffering=0) as f:
+            data = f.read(st.st_size)
+        try:
+            text = data.decode('utf-8-sig')
+        except UnicodeDecodeError as e:
+            # 잘못된 문자만 대체하고 계속 진행 (같은 파일을 다시 읽지 않음)
+            logger.warning("INI 파일 인코딩 오류, 잘못된 문자를 대체하여 로드: %s", e)
+            text = data.decode('utf-8-sig', errors='replace')
+        
+        # 단순한 INI는 정규식으로 바로 읽고, 그 외에는 configparser 사용
+        ini_data = _read_ini_text(text)
+        if ini_data is None:
+            # 값은 명령어에 그대로 들어가므로 % 보간 사용 안 함, 중복 섹션/옵션은 뒤의 값 사용
+            config = configparser.ConfigParser(interpolation=None, strict=False)
+            config.optionxform = str  # 옵션 이름 대소문자 유지
+            try:
+                config.read_string(text, source=config_path)
+            except configparser.Error as e:
+                # 파싱 오류가 있어도 읽은 부분까지는 사용
+                logger.warning("INI 파일 파싱 오류, 읽은 부분만 사용: %s", e)
+            
+            # 섹션/옵션 이름은 checkboxes/config_data 키로 반복 조회되므로 intern
+            ini_data = {
+                sys.intern(section): {sys.intern(option): value for option, value in config[section].items()}
+                for section in config.sections()
+            }
+        
+        # 디버그 메시지
+        logger.debug("INI 파일 로드 성공: %s", ini_data.keys())
+        
+        # 같은 파일의 이전 결과는 덮어씀
+        self._ini_cache[config_path] = (st.st_mtime_ns, st.st_size, ini_data)
+        return ini_data
     
     def show_status_message(self, message, is_error=False):
         """상태 표시줄에 메시지 표시"""
-        if is_error:
-            self.statusBar.setStyleSheet("background-color: #ffcccc;")
-        else:
-            self.statusBar.setStyleSheet("background-color: #ccffcc;")
+        # 스타일이 바뀔 때만 스타일시트 적용 (같은 종류의 메시지가 이어지면 다시 파싱하지 않음)
+        style = self.STATUS_ERROR_STYLE if is_error else self.STATUS_OK_STYLE
+        if style is not self._status_style:
+            self.statusBar.setStyleSheet(style)
+            self._status_style = style
         self.statusBar.showMessage(message, 5000)  # 5초 동안 메시지 표시
     
     def setup_env_variables_tab(self):
@@ -611,17 +1152,16 @@ class TrainingCommandGenerator(QMainWindow):
         gpu_group.setLayout(gpu_layout)
         self.env_variables_layout.addWidget(gpu_group)
         
-        # 테이블 위젯 생성
-        self.env_variables_table = QTableWidget()
-        self.env_variables_table.setColumnCount(3)
-        self.env_variables_table.setHorizontalHeaderLabels(['환경 변수명', '값', '활성화'])
+        # 테이블 뷰 생성 (환경 변수 목록은 모델이 보관)
+        self.env_var_model = EnvVarModel(self)
+        self.env_variables_table = QTableView()
+        self.env_variables_table.setModel(self.env_var_model)
         self.env_variables_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         self.env_variables_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
         self.env_variables_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
         
         # 자동 저장 시그널 연결
-        self.env_variables_table.cellChanged.connect(self.auto_save_env_variables)
-        self.env_variables_table.itemChanged.connect(self.auto_save_env_variables)
+        self.env_var_model.dataChanged.connect(self.auto_save_env_variables)
         
         # 버튼 영역
         button_layout = QHBoxLayout()
@@ -660,53 +1200,12 @@ class TrainingCommandGenerator(QMainWindow):
         # CUDA_VISIBLE_DEVICES 추가
         cuda_devices = self.gpu_select_edit.text().strip()
         if cuda_devices:
-            # 기존 행이 있는지 확인
-            for row in range(self.env_variables_table.rowCount()):
-                if self.env_variables_table.item(row, 0) and self.env_variables_table.item(row, 0).text() == "CUDA_VISIBLE_DEVICES":
-                    # 기존 행 업데이트
-                    self.env_variables_table.item(row, 1).setText(cuda_devices)
-                    self.env_variables_table.item(row, 2).setCheckState(Qt.Checked)
-                    break
-            else:
-                # 새 행 추가
-                row = self.env_variables_table.rowCount()
-                self.env_variables_table.insertRow(row)
-                
-                name_item = QTableWidgetItem("CUDA_VISIBLE_DEVICES")
-                self.env_variables_table.setItem(row, 0, name_item)
-                
-                value_item = QTableWidgetItem(cuda_devices)
-                self.env_variables_table.setItem(row, 1, value_item)
-                
-                checkbox = QTableWidgetItem()
-                checkbox.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-                checkbox.setCheckState(Qt.Checked)
-                self.env_variables_table.setItem(row, 2, checkbox)
+            self._set_env_variable("CUDA_VISIBLE_DEVICES", cuda_devices)
         
         # TF_MEMORY_LIMIT 추가
         memory_limit = self.gpu_memory_edit.text().strip()
         if memory_limit:
-            for row in range(self.env_variables_table.rowCount()):
-                if self.env_variables_table.item(row, 0) and self.env_variables_table.item(row, 0).text() == "TF_MEMORY_LIMIT":
-                    # 기존 행 업데이트
-                    self.env_variables_table.item(row, 1).setText(memory_limit)
-                    self.env_variables_table.item(row, 2).setCheckState(Qt.Checked)
-                    break
-            else:
-                # 새 행 추가
-                row = self.env_variables_table.rowCount()
-                self.env_variables_table.insertRow(row)
-                
-                name_item = QTableWidgetItem("TF_MEMORY_LIMIT")
-                self.env_variables_table.setItem(row, 0, name_item)
-                
-                value_item = QTableWidgetItem(memory_limit)
-                self.env_variables_table.setItem(row, 1, value_item)
-                
-                checkbox = QTableWidgetItem()
-                checkbox.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-                checkbox.setCheckState(Qt.Checked)
-                self.env_variables_table.setItem(row, 2, checkbox)
+            self._set_env_variable("TF_MEMORY_LIMIT", memory_limit)
         
         # 자동 저장 재개
         self._updating_cuda = False
@@ -715,35 +1214,35 @@ class TrainingCommandGenerator(QMainWindow):
         # 변경 내용 저장 및 명령어 갱신
         self.auto_save_env_variables()
     
+    def _set_env_variable(self, name, value):
+        """
+        환경 변수 행의 값을 바꾸고 활성화 (행이 없으면 새로 추가)
+        
+        Args:
+            name (str): 환경 변수명
+            value (str): 환경 변수 값
+        """
+        model = self.env_var_model
+        row = model.find_row(name)
+        if row < 0:
+            model.append_row(name, value)
+            return
+        model.setData(model.index(row, 1), value)
+        model.setData(model.index(row, EnvVarModel.CHECK_COLUMN), _CHECKED, Qt.CheckStateRole)
+    
     def add_env_variable_row(self):
         """환경 변수에 새 행 추가"""
-        row = self.env_variables_table.rowCount()
-        self.env_variables_table.insertRow(row)
-        
-        # 환경 변수명 열
-        name_item = QTableWidgetItem("")
-        self.env_variables_table.setItem(row, 0, name_item)
-        
-        # 값 열
-        value_item = QTableWidgetItem("")
-        self.env_variables_table.setItem(row, 1, value_item)
-        
-        # 활성화 체크박스 열
-        checkbox = QTableWidgetItem()
-        checkbox.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-        checkbox.setCheckState(Qt.Checked)
-        self.env_variables_table.setItem(row, 2, checkbox)
+        self.env_var_model.append_row()
     
     def delete_env_variable_row(self):
         """선택한 환경 변수 행 삭제"""
-        selected_rows = list(set([index.row() for index in self.env_variables_table.selectedIndexes()]))
+        selected_rows = {index.row() for index in self.env_variables_table.selectionModel().selectedIndexes()}
         if not selected_rows:
             self.show_status_message('삭제할 환경 변수를 선택해주세요.', True)
             return
             
         # 선택한 행을 역순으로 삭제 (인덱스 변화 방지)
-        for row in sorted(selected_rows, reverse=True):
-            self.env_variables_table.removeRow(row)
+        self.env_var_model.remove_rows(selected_rows)
         
         self.show_status_message('선택한 환경 변수가 삭제되었습니다.')
         # 행 삭제 후 자동 저장
@@ -758,16 +1257,10 @@ class TrainingCommandGenerator(QMainWindow):
             
         # 환경 변수 저장
         env_variables = []
-        for row in range(self.env_variables_table.rowCount()):
-            # 행에 아이템이 모두 존재하는지 확인
-            if (self.env_variables_table.item(row, 0) is None or 
-                self.env_variables_table.item(row, 1) is None or
-                self.env_variables_table.item(row, 2) is None):
-                continue
-                
-            name = self.env_variables_table.item(row, 0).text().strip()
-            value = self.env_variables_table.item(row, 1).text().strip()
-            is_enabled = self.env_variables_table.item(row, 2).checkState() == Qt.Checked
+        for var in self.env_var_model.rows():
+            name = var.get('name', '').strip()
+            value = var.get('value', '').strip()
+            is_enabled = var.get('enabled', True)
             
             if name:  # 환경 변수명이 빈 값이 아닌 경우만 저장
                 env_variables.append({
@@ -776,10 +1269,11 @@ class TrainingCommandGenerator(QMainWindow):
                     'enabled': is_enabled
                 })
         
-        # 설정 저장
+        # 설정 저장 (환경 변수가 실제로 바뀐 경우에만 저장 예약)
         self.env_variables = env_variables
-        self.settings['env_variables'] = env_variables
-        self.save_settings()
+        if env_variables != self.settings.get('env_variables'):
+            self.settings['env_variables'] = env_variables
+            self.save_settings()
         
         # 명령어 자동 갱신
         self.generate_command()
@@ -796,34 +1290,16 @@ class TrainingCommandGenerator(QMainWindow):
         
         self.env_variables = self.settings.get('env_variables', [])
         
-        # 테이블 초기화
-        self.env_variables_table.setRowCount(0)
+        # 모델의 행 목록을 한 번에 교체 (셀 항목을 만들지 않음)
+        self.env_var_model.set_rows(self.env_variables)
         
-        # 저장된 환경 변수 추가
         for var in self.env_variables:
-            row = self.env_variables_table.rowCount()
-            self.env_variables_table.insertRow(row)
-            
-            # 환경 변수명 열
-            name_item = QTableWidgetItem(var.get('name', ''))
-            self.env_variables_table.setItem(row, 0, name_item)
-            
-            # 값 열
-            value_item = QTableWidgetItem(var.get('value', ''))
-            self.env_variables_table.setItem(row, 1, value_item)
-            
-            # 활성화 체크박스 열
-            checkbox = QTableWidgetItem()
-            checkbox.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-            checkbox.setCheckState(Qt.Checked if var.get('enabled', True) else Qt.Unchecked)
-            self.env_variables_table.setItem(row, 2, checkbox)
-            
             # GPU 관련 변수면 해당 설정 폼에도 표시
             if var.get('name') == "CUDA_VISIBLE_DEVICES" and var.get('enabled', True):
                 self.gpu_select_edit.setText(var.get('value', ''))
             elif var.get('name') == "TF_MEMORY_LIMIT" and var.get('enabled', True):
                 self.gpu_memory_edit.setText(var.get('value', ''))
-                
+        
         # 로딩 완료 플래그 해제
         self._loading_env_variables = False
 
@@ -834,10 +1310,15 @@ class TrainingCommandGenerator(QMainWindow):
         description_label.setWordWrap(True)
         self.command_history_layout.addWidget(description_label)
         
-        # 테이블 위젯 생성
-        self.command_history_table = QTableWidget()
-        self.command_history_table.setColumnCount(4)
-        self.command_history_table.setHorizontalHeaderLabels(['ID', '시간', '설명', '작업'])
+        # 테이블 뷰 생성 (명령어 목록은 모델이 보관)
+        self.command_history_model = CommandHistoryModel(self)
+        self.command_history_table = QTableView()
+        self.command_history_table.setModel(self.command_history_model)
+        
+        # 작업 열 버튼은 델리게이트가 그림 (모델 리셋 중에 처리하지 않도록 클릭은 이벤트 처리 후 실행)
+        self.history_action_delegate = HistoryActionDelegate(self.command_history_table)
+        self.history_action_delegate.actionClicked.connect(self._on_history_action, Qt.QueuedConnection)
+        self.command_history_table.setItemDelegateForColumn(3, self.history_action_delegate)
         self.command_history_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
         self.command_history_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
         self.command_history_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
@@ -862,48 +1343,31 @@ class TrainingCommandGenerator(QMainWindow):
     
     def refresh_command_history(self):
         """명령어 히스토리 새로고침"""
-        self.command_history_table.setRowCount(0)
+        # 히스토리 탭을 아직 구성하지 않았으면 처음 선택될 때 로드함
+        if self.command_history_tab in self._lazy_tabs:
+            return
         
         # 모든 명령어 가져오기
         commands = self.command_manager.get_all_commands()
         commands.reverse()  # 최신 명령어가 위에 오도록 역순 정렬
         
-        # 테이블에 표시
-        for i, cmd in enumerate(commands):
-            self.command_history_table.insertRow(i)
-            
-            # ID
-            id_item = QTableWidgetItem(cmd.get('id', ''))
-            self.command_history_table.setItem(i, 0, id_item)
-            
-            # 시간
-            time_item = QTableWidgetItem(cmd.get('timestamp', ''))
-            self.command_history_table.setItem(i, 1, time_item)
-            
-            # 설명
-            desc_item = QTableWidgetItem(cmd.get('description', ''))
-            desc_item.setToolTip(cmd.get('command', ''))
-            self.command_history_table.setItem(i, 2, desc_item)
-            
-            # 작업 버튼
-            button_widget = QWidget()
-            button_layout = QHBoxLayout(button_widget)
-            button_layout.setContentsMargins(0, 0, 0, 0)
-            
-            load_button = QPushButton('로드')
-            load_button.clicked.connect(lambda _, cmd_id=cmd.get('id'): self.load_command_from_history(cmd_id))
-            
-            run_button = QPushButton('실행')
-            run_button.clicked.connect(lambda _, cmd_id=cmd.get('id'): self.run_command_from_history(cmd_id))
-            
-            delete_button = QPushButton('삭제')
-            delete_button.clicked.connect(lambda _, cmd_id=cmd.get('id'): self.delete_command_from_history(cmd_id))
-            
-            button_layout.addWidget(load_button)
-            button_layout.addWidget(run_button)
-            button_layout.addWidget(delete_button)
-            
-            self.command_history_table.setCellWidget(i, 3, button_widget)
+        # 작업 열 버튼은 델리게이트가 그리므로 모델만 교체
+        self.command_history_model.set_commands(commands)
+    
+    def _on_history_action(self, action, command_id):
+        """
+        히스토리 작업 버튼 클릭 처리
+        
+        Args:
+            action (int): HistoryActionDelegate의 버튼 번호 (로드/실행/삭제)
+            command_id (int): 명령어 ID
+        """
+        if action == HistoryActionDelegate.ACTION_LOAD:
+            self.load_command_from_history(command_id)
+        elif action == HistoryActionDelegate.ACTION_RUN:
+            self.run_command_from_history(command_id)
+        elif action == HistoryActionDelegate.ACTION_DELETE:
+            self.delete_command_from_history(command_id)
     
     def load_command_from_history(self, command_id):
         """히스토리에서 명령어 로드"""
@@ -944,12 +1408,11 @@ class TrainingCommandGenerator(QMainWindow):
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         
         if reply == QMessageBox.Yes:
-            # 모든 명령어 가져와서 하나씩 삭제
-            commands = self.command_manager.get_all_commands()
-            for cmd in commands:
-                self.command_manager.delete_command(cmd.get('id'))
-            
-            self.show_status_message('모든 명령어 히스토리가 삭제되었습니다.')
+            # 히스토리 파일을 한 번에 비움
+            if self.command_manager.clear_all():
+                self.show_status_message('모든 명령어 히스토리가 삭제되었습니다.')
+            else:
+                self.show_status_message('명령어 히스토리 삭제 중 오류가 발생했습니다.', True)
             self.refresh_command_history()
     
     def save_command_to_history(self):
@@ -979,44 +1442,21 @@ class TrainingCommandGenerator(QMainWindow):
             return
             
         # 파이썬 실행 명령어
-        python_cmd = "python" if platform.system() == "Windows" else "python3"
+        python_cmd = "python" if _IS_WINDOWS else "python3"
         command_parts = [python_cmd, script_path]
         
-        # 각 섹션별 선택된 옵션 처리
-        for param_name, checkboxes in self.checkboxes.items():
+        # 각 섹션별 선택된 옵션 처리 (load_config에서 만든 평탄화 목록을 섹션 단위로 묶어서 순회)
+        for param_name, entries in groupby(self._flat_options, key=itemgetter(0)):
             selected_values = []
             empty_section = False
             
-            # 체크박스 딕셔너리 반복
-            for option_name, checkbox in checkboxes.items():
+            for _, checkbox, value in entries:
                 if checkbox.isChecked():
-                    # 빈 섹션 처리: ON 옵션이 체크되고 다른 옵션이 없으면 빈 섹션으로 간주
-                    if option_name == "ON" and len(checkboxes) == 1:
+                    # 빈 섹션 처리: 값이 없는 ON 체크박스
+                    if value is None:
                         empty_section = True
                     else:
-                        # INI 파일에서 실제 값 가져오기
-                        if self.config_file and os.path.exists(self.config_file):
-                            try:
-                                config = configparser.ConfigParser()
-                                with open(self.config_file, encoding='utf-8') as f:
-                                    config.read_file(f)
-                                
-                                # INI 파일에서 해당 옵션 값 가져오기
-                                if param_name in config and option_name in config[param_name]:
-                                    value = config[param_name][option_name]
-                                    if value:  # 값이 있으면 추가
-                                        selected_values.append(value)
-                                    else:  # 값이 없으면 옵션 이름만 추가
-                                        selected_values.append(option_name)
-                                else:
-                                    # INI에 없는 경우 옵션 이름 그대로 사용
-                                    selected_values.append(option_name)
-                            except Exception as e:
-                                print(f"INI 파일 읽기 오류: {e}")
-                                selected_values.append(option_name)
-                        else:
-                            # INI 파일이 없는 경우 옵션 이름 사용
-                            selected_values.append(option_name)
+                        selected_values.append(value)
             
             # 빈 섹션이면 파라미터만 추가
             if empty_section:
@@ -1054,7 +1494,7 @@ class TrainingCommandGenerator(QMainWindow):
         # 환경 변수가 있을 경우 추가
         if env_vars:
             # Windows는 SET, Linux/Mac은 export 사용
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 env_cmd = " && ".join([f"SET {var}" for var in env_vars]) + " && "
             else:
                 env_cmd = " ".join([f"export {var}" for var in env_vars]) + " && "
@@ -1077,6 +1517,9 @@ class TrainingCommandGenerator(QMainWindow):
             self.show_status_message('먼저 명령어를 생성해주세요.', True)
             return
         
+        # 명령어를 실행할 때만 필요하므로 여기서 임포트
+        import subprocess
+        
         try:
             # 명령어 자동 저장 (실행 시)
             description = self.command_description_edit.text().strip()
@@ -1085,50 +1528,43 @@ class TrainingCommandGenerator(QMainWindow):
             
             command_id = self.command_manager.add_command(command, description)
             
-            # 운영체제 별로 다른 방식으로 새 터미널에서 명령어 실행
-            platform = sys.platform.lower()
-            
             # 활성화된 사전 명령어 가져오기
+            self._ensure_tab_built(self.pre_commands_tab)
             pre_commands = []
             for row in range(self.pre_commands_table.rowCount()):
                 cmd = self.pre_commands_table.item(row, 0).text().strip()
-                is_enabled = self.pre_commands_table.item(row, 2).checkState() == Qt.Checked
+                is_enabled = self.pre_commands_table.item(row, 2).checkState() == _CHECKED
                 if cmd and is_enabled:
                     pre_commands.append(cmd)
             
             # 사전 명령어와 메인 명령어 결합
             if pre_commands:
-                if platform.startswith('win'):  # Windows
+                if _IS_WINDOWS:  # Windows
                     combined_command = " && ".join(pre_commands + [command])
                 else:  # Linux/macOS
                     combined_command = "; ".join(pre_commands + [command])
             else:
                 combined_command = command
             
-            if platform.startswith('win'):  # Windows
+            # 운영체제 별로 다른 방식으로 새 터미널에서 명령어 실행
+            if _IS_WINDOWS:  # Windows
                 # Windows에서는 cmd 창에서 명령어 실행
-                # /k는 명령 실행 후 창을 유지함
-                terminal_command = f'start cmd /k "{combined_command}"'
-                subprocess.Popen(terminal_command, shell=True)
+                # /k는 명령 실행 후 창을 유지함 (start를 거치는 외부 셸 없이 새 콘솔에서 cmd 직접 실행)
+                terminal_command = f'cmd /k "{combined_command}"'
+                subprocess.Popen(terminal_command, creationflags=subprocess.CREATE_NEW_CONSOLE)
                 message = '새 명령 프롬프트 창에서 명령어가 실행되었습니다.'
                 
-            elif platform.startswith('linux'):  # Linux
-                # 일반적인 Linux 터미널 에뮬레이터 시도
-                terminal_emulators = [
-                    ['gnome-terminal', '--', 'bash', '-c', f'{combined_command}; exec bash'],
-                    ['konsole', '--', 'bash', '-c', f'{combined_command}; exec bash'],
-                    ['xterm', '-e', f'bash -c "{combined_command}; exec bash"'],
-                    ['x-terminal-emulator', '-e', f'bash -c "{combined_command}; exec bash"']
-                ]
+            elif _IS_LINUX:  # Linux
+                # 설치된 터미널 에뮬레이터 사용 (PATH 검색은 처음 한 번만 수행)
+                build_args = _find_linux_terminal()
                 
                 success = False
-                for emulator in terminal_emulators:
+                if build_args is not None:
                     try:
-                        subprocess.Popen(emulator)
+                        subprocess.Popen(build_args(combined_command))
                         success = True
-                        break
                     except FileNotFoundError:
-                        continue
+                        pass
                     
                 if success:
                     message = '새 터미널 창에서 명령어가 실행되었습니다.'
@@ -1139,9 +1575,11 @@ class TrainingCommandGenerator(QMainWindow):
                                            text=True)
                     message = f'명령어가 백그라운드에서 실행되었습니다. (터미널 에뮬레이터를 찾을 수 없음)\n출력:\n{result.stdout}'
                 
-            elif platform.startswith('darwin'):  # macOS
+            elif _IS_MACOS:  # macOS
                 # macOS에서는 새 Terminal 창에서 명령어 실행
-                terminal_command = ['osascript', '-e', f'tell app "Terminal" to do script "{combined_command}"']
+                # AppleScript 문자열 안에 넣으므로 역슬래시와 따옴표 이스케이프
+                script_command = combined_command.replace('\\', '\\\\').replace('"', '\\"')
+                terminal_command = ['osascript', '-e', f'tell app "Terminal" to do script "{script_command}"']
                 subprocess.Popen(terminal_command)
                 message = '새 Terminal 창에서 명령어가 실행되었습니다.'
                 
@@ -1168,28 +1606,17 @@ class TrainingCommandGenerator(QMainWindow):
             # 현재 선택된 구성 저장
             current_config = self.config_combo.currentText()
             
-            # 구성 콤보박스 초기화
-            self.config_combo.clear()
-            self.config_combo.addItem("")  # 빈 항목 추가
-            
-            # CSV 파일이 존재하는지 확인
-            if os.path.exists(self.csv_manager.csv_file_path):
-                # CSV 파일 읽기
-                configs = []
-                with open(self.csv_manager.csv_file_path, 'r', encoding='utf-8') as f:
-                    reader = csv.reader(f)
-                    rows = list(reader)
-                    
-                    if len(rows) >= 3:  # 헤더 2행 + 데이터 1행 이상
-                        for i, row in enumerate(rows[2:]):
-                            if row and len(row) > 0:
-                                # 첫 번째 열에 구성 번호 또는 이름이 있음
-                                config_name = row[0]
-                                configs.append(config_name)
-                
-                # 구성 콤보박스에 추가
-                for config_name in configs:
-                    self.config_combo.addItem(f"{config_name}")
+            # 구성 목록은 CSV 관리자에서 가져옴 (파일이 바뀌지 않았으면 캐시 사용)
+            configs = self.csv_manager.get_available_configs()
+            
+            # 구성 콤보박스 다시 채우기 (중간 단계의 선택 변경 시그널은 보내지 않음)
+            self.config_combo.blockSignals(True)
+            try:
+                self.config_combo.clear()
+                self.config_combo.addItem("")  # 빈 항목 추가
+                self.config_combo.addItems([str(config_name) for config_name in configs])
+            finally:
+                self.config_combo.blockSignals(False)
             
             # 이전에 선택된 구성 다시 선택
             if current_config:
@@ -1205,6 +1632,14 @@ class TrainingCommandGenerator(QMainWindow):
     def capture_current_config(self):
         """현재 UI 설정을 캡처하여 CSV 파일에 저장"""
         try:
+            # INI 파일은 한 번만 읽음 (파일이 바뀌지 않았으면 캐시된 파싱 결과 사용)
+            ini_data = {}
+            if self.config_file:
+                try:
+                    ini_data = self._parse_ini_file(self.config_file)
+                except OSError as e:
+                    logger.warning("INI 파일 읽기 오류(값 추출): %s", e)
+            
             # 체크박스 설정 캡처
             config_data = {}
             for section_name, section_checkboxes in self.checkboxes.items():
@@ -1213,16 +1648,8 @@ class TrainingCommandGenerator(QMainWindow):
                     
                     # 체크박스 상태에 따라 값 설정
                     if is_checked:
-                        # INI 파일에서 실제 값을 읽어옴
-                        value = "1"  # 기본값
-                        if self.config_file and os.path.exists(self.config_file):
-                            try:
-                                config = configparser.ConfigParser()
-                                config.read(self.config_file, encoding='utf-8')
-                                if section_name in config and param_name in config[section_name]:
-                                    value = config[section_name][param_name]
-                            except Exception as e:
-                                print(f"INI 파일 읽기 오류(값 추출): {e}")
+                        # INI 파일의 실제 값 (없으면 기본값 "1")
+                        value = ini_data.get(section_name, {}).get(param_name, "1")
                     else:
                         value = "0"  # 체크 해제된 경우 0으로 저장
                         
@@ -1291,11 +1718,17 @@ class TrainingCommandGenerator(QMainWindow):
             # 체크박스 설정 적용
             for section_name, section_config in checkboxes_config.items():
                 if section_name in self.checkboxes:
+                    section_checkboxes = self.checkboxes[section_name]
                     for param_name, param_config in section_config.items():
-                        if param_name in self.checkboxes[section_name]:
+                        checkbox = section_checkboxes.get(param_name)
+                        if checkbox is None:
+                            # 옵션 이름 대소문자를 유지하기 전에 저장된 구성은 소문자 이름을 사용함
+                            checkbox = next((cb for name, cb in section_checkboxes.items()
+                                             if name.lower() == param_name.lower()), None)
+                        if checkbox is not None:
                             is_checked = param_config.get('checked', False)  # 기본값은 체크 해제됨
                             print(f"체크박스 설정 적용: {section_name}.{param_name}={is_checked}")
-                            self.checkboxes[section_name][param_name].setChecked(is_checked)
+                            checkbox.setChecked(is_checked)
                         else:
                             print(f"체크박스를 찾을 수 없음: {section_name}.{param_name}")
                 else:
@@ -1307,10 +1740,12 @@ class TrainingCommandGenerator(QMainWindow):
             self.load_env_variables()
             
             # 사용자 정의 설정
+            self._ensure_tab_built(self.custom_tab)
             self.custom_configs = custom_configs
             self.load_custom_configs()
             
             # 사전 실행 명령어
+            self._ensure_tab_built(self.pre_commands_tab)
             self.pre_commands = pre_commands
             self.load_pre_commands()
             
@@ -1338,7 +1773,8 @@ class TrainingCommandGenerator(QMainWindow):
         # 현재 사용 중인 모든 구성 파일 경로
         config_files = {
             "설정 파일 (settings.json)": self.settings_file,
-            "CSV 구성 파일 (model_configs.csv)": self.csv_manager.csv_file_path,
+            "구성 파일 (model_configs.jsonl)": self.csv_manager.json_file_path,
+            "이전 CSV 구성 파일 (model_configs.csv)": self.csv_manager.csv_file_path,
             "현재 INI 파일": self.config_file if self.config_file else "로드된 INI 파일 없음",
             "기본 INI 파일": self.settings.get('default_ini_path', '설정된 기본 INI 파일 없음')
         }
@@ -1406,14 +1842,12 @@ class TrainingCommandGenerator(QMainWindow):
         self.pre_commands_table.setItem(row, 1, desc_item)
         
         # 활성화 체크박스 열
-        checkbox = QTableWidgetItem()
-        checkbox.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-        checkbox.setCheckState(Qt.Checked)
+        checkbox = self._new_check_item(_CHECKED)
         self.pre_commands_table.setItem(row, 2, checkbox)
     
     def delete_pre_command_row(self):
         """선택한 사전 명령어 행 삭제"""
-        selected_rows = list(set([index.row() for index in self.pre_commands_table.selectedIndexes()]))
+        selected_rows = {index.row() for index in self.pre_commands_table.selectedIndexes()}
         if not selected_rows:
             self.show_status_message('삭제할 명령어를 선택해주세요.', True)
             return
@@ -1428,7 +1862,7 @@ class TrainingCommandGenerator(QMainWindow):
     
     def move_pre_command(self, direction):
         """사전 명령어 순서 이동 (위/아래)"""
-        selected_rows = list(set([index.row() for index in self.pre_commands_table.selectedIndexes()]))
+        selected_rows = {index.row() for index in self.pre_commands_table.selectedIndexes()}
         if not selected_rows:
             self.show_status_message('이동할 명령어를 선택해주세요.', True)
             return
@@ -1438,7 +1872,7 @@ class TrainingCommandGenerator(QMainWindow):
             self.show_status_message('한 번에 하나의 명령어만 이동할 수 있습니다.', True)
             return
         
-        current_row = selected_rows[0]
+        current_row = next(iter(selected_rows))
         target_row = current_row + direction
         
         # 테이블 범위를 벗어나면 이동 불가
@@ -1448,24 +1882,13 @@ class TrainingCommandGenerator(QMainWindow):
         # 자동 저장 일시 중지
         self._moving_pre_command = True
         
-        # 행 데이터 백업
-        command = self.pre_commands_table.item(current_row, 0).text()
-        description = self.pre_commands_table.item(current_row, 1).text()
-        is_enabled = self.pre_commands_table.item(current_row, 2).checkState()
-        
-        # 현재 행 삭제
-        self.pre_commands_table.removeRow(current_row)
-        
-        # 새 위치에 행 삽입
-        self.pre_commands_table.insertRow(target_row)
-        
-        # 데이터 복원
-        self.pre_commands_table.setItem(target_row, 0, QTableWidgetItem(command))
-        self.pre_commands_table.setItem(target_row, 1, QTableWidgetItem(description))
-        checkbox = QTableWidgetItem()
-        checkbox.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-        checkbox.setCheckState(is_enabled)
-        self.pre_commands_table.setItem(target_row, 2, checkbox)
+        # 두 행의 항목을 제자리에서 맞바꿈 (행 삭제/삽입 없이, 체크 상태 등 항목 그대로 유지)
+        table = self.pre_commands_table
+        for col in range(table.columnCount()):
+            current_item = table.takeItem(current_row, col)
+            target_item = table.takeItem(target_row, col)
+            table.setItem(current_row, col, target_item)
+            table.setItem(target_row, col, current_item)
         
         # 이동된 행 선택
         self.pre_commands_table.selectRow(target_row)
@@ -1492,7 +1915,7 @@ class TrainingCommandGenerator(QMainWindow):
                 
             command = self.pre_commands_table.item(row, 0).text().strip()
             description = self.pre_commands_table.item(row, 1).text().strip()
-            is_enabled = self.pre_commands_table.item(row, 2).checkState() == Qt.Checked
+            is_enabled = self.pre_commands_table.item(row, 2).checkState() == _CHECKED
             
             if command:  # 명령어가 빈 값이 아닌 경우만 저장
                 pre_commands.append({
@@ -1521,28 +1944,28 @@ class TrainingCommandGenerator(QMainWindow):
         
         self.pre_commands = self.settings.get('pre_commands', [])
         
-        # 테이블 초기화
-        self.pre_commands_table.setRowCount(0)
+        # 테이블 초기화 (채우는 동안 화면 갱신/시그널 중지, 행은 한 번에 생성)
+        table = self.pre_commands_table
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        table.setRowCount(0)
+        table.setRowCount(len(self.pre_commands))
         
         # 저장된 명령어 추가
-        for cmd in self.pre_commands:
-            row = self.pre_commands_table.rowCount()
-            self.pre_commands_table.insertRow(row)
-            
+        for row, cmd in enumerate(self.pre_commands):
             # 명령어 열
-            cmd_item = QTableWidgetItem(cmd.get('command', ''))
-            self.pre_commands_table.setItem(row, 0, cmd_item)
+            table.setItem(row, 0, QTableWidgetItem(cmd.get('command', '')))
             
             # 설명 열
-            desc_item = QTableWidgetItem(cmd.get('description', ''))
-            self.pre_commands_table.setItem(row, 1, desc_item)
+            table.setItem(row, 1, QTableWidgetItem(cmd.get('description', '')))
             
             # 활성화 체크박스 열
-            checkbox = QTableWidgetItem()
-            checkbox.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-            checkbox.setCheckState(Qt.Checked if cmd.get('enabled', True) else Qt.Unchecked)
-            self.pre_commands_table.setItem(row, 2, checkbox)
-            
+            checkbox = self._new_check_item(_CHECKED if cmd.get('enabled', True) else _UNCHECKED)
+            table.setItem(row, 2, checkbox)
+        
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
+        
         # 로딩 완료 플래그 해제
         self._loading_pre_commands = False
 
@@ -1778,11 +2201,13 @@ class ConfigFileLocationsDialog(QDialog):
             folder_path = os.path.dirname(file_path)
             
             # 플랫폼에 따라 다른 명령어 실행
-            if sys.platform.startswith('win'):  # Windows
+            if _IS_WINDOWS:  # Windows
                 os.startfile(folder_path)
-            elif sys.platform.startswith('darwin'):  # macOS
+            elif _IS_MACOS:  # macOS
+                import subprocess
                 subprocess.call(['open', folder_path])
             else:  # Linux
+                import subprocess
                 subprocess.call(['xdg-open', folder_path])
                 
         except Exception as e: